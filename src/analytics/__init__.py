@@ -1,7 +1,21 @@
 """Analytics module for YouTube performance tracking."""
 
-from .tracker import AnalyticsTracker
-from .reporter import AnalyticsReporter
-from .html_generator import HTMLDashboardGenerator
+from importlib import import_module
 
 __all__ = ['AnalyticsTracker', 'AnalyticsReporter', 'HTMLDashboardGenerator']
+
+# Submodule for each export, imported on first access so that importing one
+# part of the package doesn't load the Google API client, Rich and Jinja2
+_EXPORTS = {
+    'AnalyticsTracker': '.tracker',
+    'AnalyticsReporter': '.reporter',
+    'HTMLDashboardGenerator': '.html_generator',
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
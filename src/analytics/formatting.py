@@ -0,0 +1,16 @@
+"""Number formatting shared by the terminal reports and the HTML dashboard."""
+
+from functools import lru_cache
+
+
+# (threshold, suffix) pairs, largest first
+_NUMBER_UNITS = ((1_000_000, 'M'), (1_000, 'K'))
+
+
+@lru_cache(maxsize=4096)
+def format_number(num: int) -> str:
+    """Format large numbers with K/M suffixes (memoized)."""
+    for threshold, suffix in _NUMBER_UNITS:
+        if num >= threshold:
+            return f"{num / threshold:.1f}{suffix}"
+    return str(num)
@@ -1,11 +1,114 @@
 """Analytics reporter for generating formatted reports."""
 
-from datetime import datetime
-from typing import Dict, List
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .formatting import format_number
+
+if TYPE_CHECKING:
+    # Rich is imported lazily where it is used to keep CLI start-up fast
+    from rich.table import Table
+    from rich.text import Text
+
+
+def _parse_published(published_at: str) -> datetime:
+    """Parse a YouTube publishedAt timestamp into an aware UTC datetime."""
+    try:
+        # Fast path for the API's fixed "2024-01-31T12:00:00Z" format
+        return datetime.strptime(published_at, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        pub_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        if pub_date.tzinfo is None:
+            pub_date = pub_date.replace(tzinfo=timezone.utc)
+        return pub_date
+
+
+def _fmt_change(value: int, show_plus: bool = True) -> "Text":
+    """Format change value with color coding, as styled Text (no markup parsing)."""
+    from rich.text import Text
+
+    if value > 0:
+        prefix = "+" if show_plus else ""
+        return Text(f"{prefix}{format_number(value)}", style="green")
+    elif value < 0:
+        return Text(format_number(value), style="red")
+    else:
+        return Text(str(value), style="dim")
+
+
+# Column schemas for the report tables, declared once: (header, column options)
+_METRIC_COLUMNS = (
+    ("Metric", {"style": "cyan"}),
+    ("Value", {"style": "bold"}),
+)
+_OVERVIEW_COLUMNS = _METRIC_COLUMNS + (
+    ("Change", {"justify": "right"}),
+)
+_TOP_COLUMNS = (
+    ("#", {"style": "dim", "width": 3}),
+    ("Title", {"style": "cyan", "no_wrap": False, "max_width": 40}),
+    ("Views", {"justify": "right", "style": "green"}),
+    ("Likes", {"justify": "right"}),
+    ("Engage %", {"justify": "right"}),
+)
+_UNDERPERFORMING_COLUMNS = (
+    ("Title", {"style": "yellow", "no_wrap": False, "max_width": 45}),
+    ("Views", {"justify": "right"}),
+    ("Published", {"justify": "right", "style": "dim"}),
+)
+
+
+@dataclass
+class VideoAggregates:
+    """Totals over a list of video analytics rows, computed once per report."""
+    count: int
+    total_views: int
+    total_likes: int
+    total_comments: int
+    avg_engagement: float
+
+
+def _aggregate(videos_data: List[Dict]) -> Optional[VideoAggregates]:
+    """Aggregate video totals in a single pass (None if there are no videos)."""
+    if not videos_data:
+        return None
+
+    total_views = total_likes = total_comments = 0
+    total_engagement = 0
+    for v in videos_data:
+        total_views += v['views']
+        total_likes += v['likes']
+        total_comments += v['comments']
+        total_engagement += v['engagement_rate']
+
+    return VideoAggregates(
+        count=len(videos_data),
+        total_views=total_views,
+        total_likes=total_likes,
+        total_comments=total_comments,
+        avg_engagement=total_engagement / len(videos_data)
+    )
+
+
+def _metric_table(columns) -> "Table":
+    """Build a borderless key/value table from a column schema."""
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def _list_table(columns) -> "Table":
+    """Build a headed list table from a column schema."""
+    from rich.table import Table
+
+    table = Table(show_header=True, show_lines=False)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
 
 class AnalyticsReporter:
@@ -13,25 +116,17 @@ class AnalyticsReporter:
 
     def __init__(self):
         """Initialize the reporter."""
+        from rich.console import Console
+
         self.console = Console()
 
     def format_number(self, num: int) -> str:
         """Format large numbers with K/M suffixes."""
-        if num >= 1_000_000:
-            return f"{num/1_000_000:.1f}M"
-        elif num >= 1_000:
-            return f"{num/1_000:.1f}K"
-        return str(num)
+        return format_number(num)
 
-    def format_change(self, value: int, show_plus: bool = True) -> str:
+    def format_change(self, value: int, show_plus: bool = True) -> "Text":
         """Format change value with color coding."""
-        if value > 0:
-            prefix = "+" if show_plus else ""
-            return f"[green]{prefix}{self.format_number(value)}[/green]"
-        elif value < 0:
-            return f"[red]{self.format_number(value)}[/red]"
-        else:
-            return f"[dim]{value}[/dim]"
+        return _fmt_change(value, show_plus)
 
     def generate_dashboard_report(
         self,
@@ -57,21 +152,24 @@ class AnalyticsReporter:
         self.console.print("=" * 80, style="cyan")
         self.console.print()
 
+        agg = _aggregate(videos_data)
+        now_utc = datetime.now(timezone.utc)
+
         # Channel Overview
         self._print_channel_overview(channel_data, growth_metrics)
 
         # Recent Performance
-        self._print_recent_performance(videos_data, growth_metrics)
+        self._print_recent_performance(growth_metrics, agg)
 
         # Top Performers
         self._print_top_performers(top_videos)
 
         # Underperforming Videos
         if underperforming:
-            self._print_underperforming(underperforming)
+            self._print_underperforming(underperforming, now_utc)
 
         # Insights & Recommendations
-        self._print_insights(channel_data, videos_data, growth_metrics)
+        self._print_insights(channel_data, growth_metrics, agg)
 
         self.console.print()
 
@@ -80,10 +178,7 @@ class AnalyticsReporter:
         self.console.print("\n[bold]📺 CHANNEL OVERVIEW[/bold]")
         self.console.print("─" * 80, style="dim")
 
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="bold")
-        table.add_column("Change", justify="right")
+        table = _metric_table(_OVERVIEW_COLUMNS)
 
         # Subscribers
         sub_change = growth_metrics.get('subscriber_growth', 0)
@@ -110,32 +205,24 @@ class AnalyticsReporter:
 
         self.console.print(table)
 
-    def _print_recent_performance(self, videos_data: List[Dict], growth_metrics: Dict):
+    def _print_recent_performance(self, growth_metrics: Dict, agg: Optional[VideoAggregates]):
         """Print recent performance metrics."""
         self.console.print("\n[bold]📈 RECENT PERFORMANCE[/bold]")
         days = growth_metrics.get('period_days', 7)
         self.console.print(f"[dim]Last {days} days[/dim]")
         self.console.print("─" * 80, style="dim")
 
-        if not videos_data:
+        if agg is None:
             self.console.print("[yellow]No recent video data available[/yellow]")
             return
 
-        # Calculate aggregates
-        total_views = sum(v['views'] for v in videos_data)
-        total_likes = sum(v['likes'] for v in videos_data)
-        total_comments = sum(v['comments'] for v in videos_data)
-        avg_engagement = sum(v['engagement_rate'] for v in videos_data) / len(videos_data)
-
-        table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="bold")
+        table = _metric_table(_METRIC_COLUMNS)
 
-        table.add_row("Videos Tracked", str(len(videos_data)))
-        table.add_row("Total Views", self.format_number(total_views))
-        table.add_row("Total Likes", self.format_number(total_likes))
-        table.add_row("Total Comments", self.format_number(total_comments))
-        table.add_row("Avg Engagement Rate", f"{avg_engagement:.2f}%")
+        table.add_row("Videos Tracked", str(agg.count))
+        table.add_row("Total Views", self.format_number(agg.total_views))
+        table.add_row("Total Likes", self.format_number(agg.total_likes))
+        table.add_row("Total Comments", self.format_number(agg.total_comments))
+        table.add_row("Avg Engagement Rate", f"{agg.avg_engagement:.2f}%")
 
         self.console.print(table)
 
@@ -148,12 +235,7 @@ class AnalyticsReporter:
             self.console.print("[yellow]No video data available[/yellow]")
             return
 
-        table = Table(show_header=True, show_lines=False)
-        table.add_column("#", style="dim", width=3)
-        table.add_column("Title", style="cyan", no_wrap=False, max_width=40)
-        table.add_column("Views", justify="right", style="green")
-        table.add_column("Likes", justify="right")
-        table.add_column("Engage %", justify="right")
+        table = _list_table(_TOP_COLUMNS)
 
         for idx, video in enumerate(top_videos[:10], 1):
             title = video['title'][:37] + "..." if len(video['title']) > 40 else video['title']
@@ -168,26 +250,25 @@ class AnalyticsReporter:
 
         self.console.print(table)
 
-    def _print_underperforming(self, videos: List[Dict]):
+    def _print_underperforming(self, videos: List[Dict], now_utc: Optional[datetime] = None):
         """Print underperforming videos."""
         self.console.print("\n[bold]⚠️  VIDEOS NEEDING ATTENTION[/bold]")
         self.console.print("[dim]Bottom 25% by views[/dim]")
         self.console.print("─" * 80, style="dim")
 
-        table = Table(show_header=True, show_lines=False)
-        table.add_column("Title", style="yellow", no_wrap=False, max_width=45)
-        table.add_column("Views", justify="right")
-        table.add_column("Published", justify="right", style="dim")
+        table = _list_table(_UNDERPERFORMING_COLUMNS)
+
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
 
         for video in videos[:5]:
             title = video['title'][:42] + "..." if len(video['title']) > 45 else video['title']
 
             # Format published date
             try:
-                pub_date = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
-                days_ago = (datetime.now(pub_date.tzinfo) - pub_date).days
-                pub_str = f"{days_ago}d ago"
-            except:
+                pub_date = _parse_published(video['published_at'])
+                pub_str = f"{(now_utc - pub_date).days}d ago"
+            except (KeyError, AttributeError, TypeError, ValueError):
                 pub_str = "N/A"
 
             table.add_row(
@@ -198,7 +279,7 @@ class AnalyticsReporter:
 
         self.console.print(table)
 
-    def _print_insights(self, channel_data: Dict, videos_data: List[Dict], growth_metrics: Dict):
+    def _print_insights(self, channel_data: Dict, growth_metrics: Dict, agg: Optional[VideoAggregates]):
         """Print AI-generated insights and recommendations."""
         self.console.print("\n[bold]💡 INSIGHTS & RECOMMENDATIONS[/bold]")
         self.console.print("─" * 80, style="dim")
@@ -206,14 +287,15 @@ class AnalyticsReporter:
         insights = []
 
         # Growth insight
-        if growth_metrics.get('subscriber_growth', 0) > 0:
-            insights.append(f"✅ Growing! +{growth_metrics['subscriber_growth']} subscribers")
-        elif growth_metrics.get('subscriber_growth', 0) < 0:
-            insights.append(f"⚠️  Losing subscribers: {growth_metrics['subscriber_growth']}")
+        sub_growth = growth_metrics.get('subscriber_growth', 0)
+        if sub_growth > 0:
+            insights.append(f"✅ Growing! +{sub_growth} subscribers")
+        elif sub_growth < 0:
+            insights.append(f"⚠️  Losing subscribers: {sub_growth}")
 
         # Engagement insight
-        if videos_data:
-            avg_engagement = sum(v['engagement_rate'] for v in videos_data) / len(videos_data)
+        if agg is not None:
+            avg_engagement = agg.avg_engagement
             if avg_engagement > 5:
                 insights.append(f"✅ Strong engagement: {avg_engagement:.1f}% avg rate")
             elif avg_engagement < 2:
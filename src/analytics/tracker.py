@@ -1,40 +1,258 @@
 """Analytics tracker for fetching YouTube performance data."""
 
+import bisect
+import heapq
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-from googleapiclient.errors import HttpError
+from threading import local
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils import jsonio
 
 
 class AnalyticsTracker:
     """Tracks YouTube analytics data and stores historical records."""
 
-    def __init__(self, youtube_service, data_dir: str = "data"):
+    def __init__(self, youtube_service, credentials, data_dir: str = "data"):
         """
         Initialize analytics tracker.
 
         Args:
             youtube_service: Authenticated YouTube API service
+            credentials: Credentials the service was built with, used to
+                authorize the per-thread transports
             data_dir: Directory to store analytics data
         """
         self.youtube = youtube_service
+        self.credentials = credentials
+        # Per-thread keep-alive transports for requests run off the default one
+        self._side_http = local()
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        # Legacy single-file history, migrated to the append-only logs on first load
         self.analytics_file = self.data_dir / "analytics_history.json"
+        self.snapshots_file = self.data_dir / "snapshots.ndjson"
+        self.video_snapshots_file = self.data_dir / "video_snapshots.ndjson"
+        # [lines, readable records] per log, kept current so compaction checks are O(1)
+        self._log_counts = {}
         self.history = self._load_history()
+        self.compact()
+        # Snapshot epochs in append (chronological) order, for windowed lookups
+        self._snapshot_epochs = [s['timestamp_epoch'] for s in self.history['snapshots']]
 
     def _load_history(self) -> Dict:
-        """Load historical analytics data."""
-        if self.analytics_file.exists():
+        """
+        Load historical analytics data by replaying the append-only logs.
+
+        The video log is streamed line by line and only each video's metadata
+        and latest snapshot are kept in memory; full per-video histories are
+        read on demand by get_video_snapshots().
+        """
+        if not self.snapshots_file.exists() and self.analytics_file.exists():
             with open(self.analytics_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"snapshots": [], "videos": {}}
+                legacy = jsonio.loads(f.read())
+            self._backfill_epochs(legacy['snapshots'])
+            self._rewrite_log(self.video_snapshots_file, self._video_records(legacy['videos']))
+            self._rewrite_log(self.snapshots_file, legacy['snapshots'])
+            del legacy
+
+        snapshots, bad_snapshots = self._read_records(self.snapshots_file)
+
+        history = {"snapshots": snapshots, "videos": {}, "latest": {}}
+        videos = history['videos']
+        latest = history['latest']
+        video_records = 0
+        bad_videos = 0
+        for record in self._iter_records(self.video_snapshots_file):
+            if record is None:
+                bad_videos += 1
+                continue
+            video_records += 1
+            video_id, title, published_at = self._split_video_record(record)
+            if video_id not in videos:
+                videos[video_id] = {
+                    'title': title,
+                    'published_at': published_at
+                }
+            latest[video_id] = self._latest_row(video_id, videos[video_id], record)
+
+        self._log_counts[self.snapshots_file] = [len(snapshots) + bad_snapshots, len(snapshots)]
+        self._log_counts[self.video_snapshots_file] = [video_records + bad_videos, video_records]
+
+        # Persist backfilled epochs by rewriting the snapshot log (this also
+        # drops its unreadable lines)
+        if self._backfill_epochs(snapshots):
+            self._rewrite_log(self.snapshots_file, snapshots)
+            self._log_counts[self.snapshots_file] = [len(snapshots), len(snapshots)]
+
+        return history
+
+    @staticmethod
+    def _split_video_record(record: Dict) -> Tuple[str, str, str]:
+        """Strip the video fields from a log record in place, leaving the bare snapshot."""
+        return record.pop('video_id'), record.pop('title'), record.pop('published_at')
+
+    @staticmethod
+    def _latest_row(video_id: str, video_data: Dict, snapshot: Dict) -> Dict:
+        """Build the flattened row for a video's most recent snapshot."""
+        return {
+            'video_id': video_id,
+            'title': video_data['title'],
+            'published_at': video_data['published_at'],
+            **snapshot
+        }
+
+    @staticmethod
+    def _backfill_epochs(snapshots: List[Dict]) -> int:
+        """Add 'timestamp_epoch' to snapshots written before it existed, returning the count."""
+        backfilled = 0
+        for snapshot in snapshots:
+            if 'timestamp_epoch' not in snapshot:
+                snapshot['timestamp_epoch'] = datetime.fromisoformat(snapshot['timestamp']).timestamp()
+                backfilled += 1
+        return backfilled
+
+    @staticmethod
+    def _iter_records(path: Path) -> Iterator[Optional[Dict]]:
+        """Stream an NDJSON file, yielding parsed records (None for unreadable lines)."""
+        if not path.exists():
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield jsonio.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+
+    @classmethod
+    def _valid_records(cls, path: Path) -> Iterator[Dict]:
+        """Stream the readable records of an NDJSON file."""
+        return (record for record in cls._iter_records(path) if record is not None)
+
+    @classmethod
+    def _read_records(cls, path: Path) -> Tuple[List[Dict], int]:
+        """Read an NDJSON file, returning parsed records and the count of unreadable lines."""
+        records = []
+        bad_lines = 0
+        for record in cls._iter_records(path):
+            if record is None:
+                bad_lines += 1
+            else:
+                records.append(record)
+        return records, bad_lines
+
+    def _append_records(self, path: Path, records: Iterable[Dict]):
+        """Append records to an NDJSON log with a single write and fsync."""
+        lines = [jsonio.dumps(record) + "\n" for record in records]
+        if not lines:
+            return
+        data = ''.join(lines).encode('utf-8')
+        with open(path, 'ab+') as f:
+            # Start on a fresh line if an interrupted write left a partial one
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        counts = self._log_counts.setdefault(path, [0, 0])
+        counts[0] += len(lines)
+        counts[1] += len(lines)
+
+    @staticmethod
+    def _video_records(videos: Dict) -> Iterator[Dict]:
+        """Flatten legacy per-video snapshot lists into self-contained log records."""
+        for video_id, video_data in videos.items():
+            for snapshot in video_data['snapshots']:
+                yield {
+                    'video_id': video_id,
+                    'title': video_data['title'],
+                    'published_at': video_data['published_at'],
+                    **snapshot
+                }
+
+    @staticmethod
+    def _rewrite_log(path: Path, records: Iterable[Dict]):
+        """Rewrite an NDJSON log from streamed records (atomically, via temp file + rename)."""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(jsonio.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def compact(self, force: bool = False):
+        """
+        Rewrite the snapshot logs without their unreadable lines.
+
+        A log is only rewritten once it has more than twice as many lines as
+        readable records, so the cost is amortized over the appends.
+
+        Args:
+            force: Rewrite both logs regardless of how many lines are unreadable
+        """
+        logs = (
+            (self.snapshots_file, lambda: self.history['snapshots']),
+            (self.video_snapshots_file, lambda: self._valid_records(self.video_snapshots_file)),
+        )
+        for path, records in logs:
+            lines, active = self._log_counts.get(path, (0, 0))
+            if force or lines > 2 * active:
+                self._rewrite_log(path, records())
+                self._log_counts[path] = [active, active]
+
+    def export_pretty(self, path: str) -> str:
+        """
+        Export the full history as one indented JSON document for reading by eye.
+
+        The logs themselves stay compact; this is an explicit, on-demand export
+        in the same shape as the legacy analytics_history.json.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Absolute path to the exported file
+        """
+        videos = {
+            video_id: {**video_data, 'snapshots': []}
+            for video_id, video_data in self.history['videos'].items()
+        }
+        for record in self._valid_records(self.video_snapshots_file):
+            video_id, _, _ = self._split_video_record(record)
+            if video_id in videos:
+                videos[video_id]['snapshots'].append(record)
+
+        output_path = Path(path)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'snapshots': self.history['snapshots'], 'videos': videos}, f, indent=2, ensure_ascii=False)
+
+        return str(output_path.absolute())
 
-    def _save_history(self):
-        """Save analytics history to file."""
-        with open(self.analytics_file, 'w', encoding='utf-8') as f:
-            json.dump(self.history, f, indent=2, ensure_ascii=False)
+    def get_video_snapshots(self, video_id: str) -> List[Dict]:
+        """
+        Load the full snapshot history of a single video from the log.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            List of snapshots for the video, oldest first
+        """
+        snapshots = []
+        for record in self._valid_records(self.video_snapshots_file):
+            if record['video_id'] == video_id:
+                self._split_video_record(record)
+                snapshots.append(record)
+        return snapshots
 
     def fetch_channel_analytics(self, days: int = 28) -> Dict:
         """
@@ -46,36 +264,53 @@ class AnalyticsTracker:
         Returns:
             Dictionary with channel analytics
         """
-        end_date = datetime.now().date()
+        from googleapiclient.errors import HttpError
+
+        now = datetime.now()
+        end_date = now.date()
         start_date = end_date - timedelta(days=days)
 
         try:
-            # Fetch channel statistics
-            channels_response = self.youtube.channels().list(
-                part='statistics,snippet',
-                mine=True
-            ).execute()
-
-            if not channels_response.get('items'):
-                raise Exception("No channel found")
-
-            channel = channels_response['items'][0]
-            stats = channel['statistics']
-
             # YouTube Analytics API reports (requires YouTube Analytics API enabled)
             try:
-                analytics = self.youtube.reports().query(
+                reports_request = self.youtube.reports().query(
                     ids='channel==MINE',
                     startDate=start_date.isoformat(),
                     endDate=end_date.isoformat(),
                     metrics='views,estimatedMinutesWatched,averageViewDuration,subscribersGained,subscribersLost',
                     dimensions='day'
-                ).execute()
+                )
+            except AttributeError:
+                # Analytics API not available on this service
+                reports_request = None
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Run the reports query alongside the channel statistics request
+                reports_future = (
+                    executor.submit(self._execute_isolated, reports_request)
+                    if reports_request is not None else None
+                )
+
+                # Fetch channel statistics (off the default transport as well, so
+                # channel analytics can be fetched alongside other requests)
+                channels_response = self._execute_isolated(self.youtube.channels().list(
+                    part='statistics,snippet',
+                    mine=True
+                ))
 
-                analytics_data = analytics.get('rows', [])
-            except (HttpError, AttributeError):
-                # Analytics API not available, use basic stats only
                 analytics_data = []
+                if reports_future is not None:
+                    try:
+                        analytics_data = reports_future.result().get('rows', [])
+                    except (HttpError, AttributeError):
+                        # Analytics API not available, use basic stats only
+                        analytics_data = []
+
+            if not channels_response.get('items'):
+                raise Exception("No channel found")
+
+            channel = channels_response['items'][0]
+            stats = channel['statistics']
 
             return {
                 'channel_id': channel['id'],
@@ -87,12 +322,35 @@ class AnalyticsTracker:
                 'period_start': start_date.isoformat(),
                 'period_end': end_date.isoformat(),
                 'daily_analytics': analytics_data,
-                'fetched_at': datetime.now().isoformat()
+                'fetched_at': now.isoformat()
             }
 
         except Exception as e:
             raise Exception(f"Error fetching channel analytics: {e}")
 
+    def _execute_isolated(self, request) -> Dict:
+        """
+        Execute an API request on the calling thread's own HTTP connection.
+
+        httplib2 connections are not thread-safe, so requests run from worker
+        threads must not share the service's default transport (or each
+        other's). Each thread's transport is created once and reused, so its
+        TLS connection stays alive across calls.
+
+        Args:
+            request: googleapiclient HttpRequest to execute
+
+        Returns:
+            Parsed API response
+        """
+        http = getattr(self._side_http, 'http', None)
+        if http is None:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http
+
+            http = self._side_http.http = AuthorizedHttp(self.credentials, http=build_http())
+        return request.execute(http=http)
+
     def fetch_video_analytics(self, video_ids: Optional[List[str]] = None, limit: int = 50) -> List[Dict]:
         """
         Fetch detailed analytics for videos.
@@ -106,28 +364,14 @@ class AnalyticsTracker:
         """
         try:
             if not video_ids:
-                # Fetch recent videos
-                search_response = self.youtube.search().list(
-                    part='id',
-                    forMine=True,
-                    type='video',
-                    order='date',
-                    maxResults=limit
-                ).execute()
-
-                video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+                video_ids = self._recent_video_ids(limit)
 
             if not video_ids:
                 return []
 
-            # Fetch video statistics
-            videos_response = self.youtube.videos().list(
-                part='statistics,snippet,contentDetails',
-                id=','.join(video_ids[:50])  # API limit is 50
-            ).execute()
-
+            fetched_at = datetime.now().isoformat()
             videos_data = []
-            for video in videos_response.get('items', []):
+            for video in self._fetch_video_items(video_ids):
                 stats = video['statistics']
                 snippet = video['snippet']
 
@@ -139,7 +383,7 @@ class AnalyticsTracker:
                     'likes': int(stats.get('likeCount', 0)),
                     'comments': int(stats.get('commentCount', 0)),
                     'duration': video['contentDetails']['duration'],
-                    'fetched_at': datetime.now().isoformat()
+                    'fetched_at': fetched_at
                 }
 
                 # Calculate engagement rate
@@ -157,6 +401,84 @@ class AnalyticsTracker:
         except Exception as e:
             raise Exception(f"Error fetching video analytics: {e}")
 
+    def _recent_video_ids(self, limit: int) -> List[str]:
+        """
+        List the IDs of the channel's most recent videos.
+
+        Search returns at most 50 results per page, so pages are followed
+        until limit IDs are collected or the results run out.
+
+        Args:
+            limit: Maximum number of video IDs to return
+
+        Returns:
+            Video IDs, newest first
+        """
+        video_ids = []
+        page_token = None
+        while len(video_ids) < limit:
+            search_response = self.youtube.search().list(
+                part='id',
+                forMine=True,
+                type='video',
+                order='date',
+                maxResults=min(50, limit - len(video_ids)),
+                pageToken=page_token
+            ).execute()
+
+            video_ids.extend(item['id']['videoId'] for item in search_response.get('items', []))
+            page_token = search_response.get('nextPageToken')
+            if not page_token:
+                break
+
+        return video_ids[:limit]
+
+    def _fetch_video_items(self, video_ids: List[str]) -> List[Dict]:
+        """
+        Fetch video resources in chunks of 50 IDs (the API limit per call).
+
+        All chunks are sent in a single batch HTTP request, so fetching more
+        than 50 videos still costs one round-trip.
+
+        Args:
+            video_ids: Video IDs to fetch
+
+        Returns:
+            List of video resources, in request order
+        """
+        chunks = [video_ids[i:i + 50] for i in range(0, len(video_ids), 50)]
+
+        def _request(chunk):
+            return self.youtube.videos().list(
+                part='statistics,snippet,contentDetails',
+                id=','.join(chunk)
+            )
+
+        if len(chunks) == 1:
+            return _request(chunks[0]).execute().get('items', [])
+
+        responses = {}
+        errors = []
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                errors.append(exception)
+            else:
+                responses[int(request_id)] = response
+
+        batch = self.youtube.new_batch_http_request(callback=_collect)
+        for idx, chunk in enumerate(chunks):
+            batch.add(_request(chunk), request_id=str(idx))
+        batch.execute()
+
+        if errors:
+            raise errors[0]
+
+        items = []
+        for idx in range(len(chunks)):
+            items.extend(responses.get(idx, {}).get('items', []))
+        return items
+
     def save_snapshot(self, channel_data: Dict, videos_data: List[Dict]):
         """
         Save a snapshot of current analytics.
@@ -165,36 +487,61 @@ class AnalyticsTracker:
             channel_data: Channel analytics data
             videos_data: List of video analytics data
         """
+        # Aggregate totals in a single pass over the videos
+        total_views = 0
+        total_engagement = 0
+        total_engagement_rate = 0
+        for v in videos_data:
+            total_views += v['views']
+            total_engagement += v['likes'] + v['comments']
+            total_engagement_rate += v['engagement_rate']
+
+        now = datetime.now()
+        timestamp = now.isoformat()
         snapshot = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
+            'timestamp_epoch': now.timestamp(),
             'channel': channel_data,
             'video_count': len(videos_data),
-            'total_views': sum(v['views'] for v in videos_data),
-            'total_engagement': sum(v['likes'] + v['comments'] for v in videos_data),
-            'avg_engagement_rate': sum(v['engagement_rate'] for v in videos_data) / len(videos_data) if videos_data else 0
+            'total_views': total_views,
+            'total_engagement': total_engagement,
+            'avg_engagement_rate': total_engagement_rate / len(videos_data) if videos_data else 0
         }
 
         self.history['snapshots'].append(snapshot)
+        self._snapshot_epochs.append(snapshot['timestamp_epoch'])
 
         # Update video history
+        video_records = []
         for video in videos_data:
             video_id = video['video_id']
             if video_id not in self.history['videos']:
                 self.history['videos'][video_id] = {
                     'title': video['title'],
-                    'published_at': video['published_at'],
-                    'snapshots': []
+                    'published_at': video['published_at']
                 }
 
-            self.history['videos'][video_id]['snapshots'].append({
-                'timestamp': datetime.now().isoformat(),
+            video_snapshot = {
+                'timestamp': timestamp,
                 'views': video['views'],
                 'likes': video['likes'],
                 'comments': video['comments'],
                 'engagement_rate': video['engagement_rate']
+            }
+            self.history['latest'][video_id] = self._latest_row(
+                video_id, self.history['videos'][video_id], video_snapshot
+            )
+            video_records.append({
+                'video_id': video_id,
+                'title': video['title'],
+                'published_at': video['published_at'],
+                **video_snapshot
             })
 
-        self._save_history()
+        # Append only the new records instead of rewriting the whole history
+        self._append_records(self.snapshots_file, [snapshot])
+        self._append_records(self.video_snapshots_file, video_records)
+        self.compact()
 
     def get_growth_metrics(self, days: int = 7) -> Dict:
         """
@@ -206,24 +553,25 @@ class AnalyticsTracker:
         Returns:
             Dictionary with growth metrics
         """
-        if len(self.history['snapshots']) < 2:
+        snapshots = self.history['snapshots']
+        if len(snapshots) < 2:
             return {
                 'insufficient_data': True,
                 'message': 'Need at least 2 snapshots to calculate growth'
             }
 
-        # Get recent snapshots within the time period
-        cutoff_time = datetime.now() - timedelta(days=days)
-        recent_snapshots = [
-            s for s in self.history['snapshots']
-            if datetime.fromisoformat(s['timestamp']) >= cutoff_time
-        ]
+        # Find the first snapshot within the time period (snapshots are appended
+        # in chronological order, so the window is a suffix of the list)
+        cutoff_epoch = time.time() - days * 86400
+        start = bisect.bisect_left(self._snapshot_epochs, cutoff_epoch)
+        snapshots_compared = len(snapshots) - start
 
-        if len(recent_snapshots) < 2:
-            recent_snapshots = self.history['snapshots'][-2:]
+        if snapshots_compared < 2:
+            start = len(snapshots) - 2
+            snapshots_compared = 2
 
-        oldest = recent_snapshots[0]
-        newest = recent_snapshots[-1]
+        oldest = snapshots[start]
+        newest = snapshots[-1]
 
         # Calculate growth
         views_growth = newest['total_views'] - oldest['total_views']
@@ -243,7 +591,7 @@ class AnalyticsTracker:
             'new_total_views': newest['total_views'],
             'old_subscribers': old_subs,
             'new_subscribers': new_subs,
-            'snapshots_compared': len(recent_snapshots)
+            'snapshots_compared': snapshots_compared
         }
 
     def get_top_performing_videos(self, metric: str = 'views', limit: int = 10) -> List[Dict]:
@@ -257,22 +605,11 @@ class AnalyticsTracker:
         Returns:
             List of top performing videos
         """
-        videos_with_latest = []
+        latest_rows = self.history['latest'].values()
 
-        for video_id, video_data in self.history['videos'].items():
-            if video_data['snapshots']:
-                latest = video_data['snapshots'][-1]
-                videos_with_latest.append({
-                    'video_id': video_id,
-                    'title': video_data['title'],
-                    'published_at': video_data['published_at'],
-                    **latest
-                })
-
-        # Sort by specified metric
-        videos_with_latest.sort(key=lambda x: x.get(metric, 0), reverse=True)
-
-        return videos_with_latest[:limit]
+        # Select the top entries by metric without sorting the whole list
+        top = heapq.nlargest(limit, latest_rows, key=lambda x: x.get(metric, 0))
+        return [dict(row) for row in top]
 
     def get_underperforming_videos(self, threshold_percentile: int = 25, limit: int = 10) -> List[Dict]:
         """
@@ -285,28 +622,21 @@ class AnalyticsTracker:
         Returns:
             List of underperforming videos
         """
-        videos_with_latest = []
-
-        for video_id, video_data in self.history['videos'].items():
-            if video_data['snapshots']:
-                latest = video_data['snapshots'][-1]
-                videos_with_latest.append({
-                    'video_id': video_id,
-                    'title': video_data['title'],
-                    'published_at': video_data['published_at'],
-                    **latest
-                })
+        latest_rows = list(self.history['latest'].values())
 
-        if not videos_with_latest:
+        if not latest_rows:
             return []
 
-        # Calculate threshold
-        views = sorted([v['views'] for v in videos_with_latest])
+        # Calculate threshold (k-th smallest view count, no full sort needed)
+        views = [v['views'] for v in latest_rows]
         threshold_index = int(len(views) * threshold_percentile / 100)
-        threshold_views = views[threshold_index] if threshold_index < len(views) else views[0]
+        if threshold_index < len(views):
+            threshold_views = heapq.nsmallest(threshold_index + 1, views)[-1]
+        else:
+            threshold_views = min(views)
 
         # Filter underperforming
-        underperforming = [v for v in videos_with_latest if v['views'] <= threshold_views]
-        underperforming.sort(key=lambda x: x['views'])
+        underperforming = [v for v in latest_rows if v['views'] <= threshold_views]
 
-        return underperforming[:limit]
+        bottom = heapq.nsmallest(limit, underperforming, key=lambda x: x['views'])
+        return [dict(row) for row in bottom]
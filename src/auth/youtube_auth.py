@@ -1,21 +1,25 @@
 """YouTube OAuth2 authentication module."""
 
+import json
 import os
 import pickle
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+if TYPE_CHECKING:
+    # Google client libraries are imported lazily where they are used, so
+    # commands that never authenticate don't pay their import cost
+    from google.oauth2.credentials import Credentials
 
 
 # YouTube API scopes - we need force-ssl to update video metadata
 SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
 
 # Token storage path
-TOKEN_FILE = Path('config/token.pickle')
+TOKEN_FILE = Path('config/token.json')
+
+# Pickled token written by older versions; migrated to TOKEN_FILE on first load
+LEGACY_TOKEN_FILE = Path('config/token.pickle')
 
 
 class YouTubeAuthenticator:
@@ -29,9 +33,9 @@ class YouTubeAuthenticator:
             client_secrets_file: Path to the OAuth2 client secrets JSON file
         """
         self.client_secrets_file = client_secrets_file
-        self.credentials: Optional[Credentials] = None
+        self.credentials: Optional["Credentials"] = None
 
-    def authenticate(self) -> Credentials:
+    def authenticate(self) -> "Credentials":
         """
         Authenticate with YouTube and return valid credentials.
 
@@ -53,18 +57,20 @@ class YouTubeAuthenticator:
             )
 
         # Try to load existing credentials
-        if TOKEN_FILE.exists():
-            with open(TOKEN_FILE, 'rb') as token:
-                self.credentials = pickle.load(token)
+        self.credentials = self._load_token()
 
         # If credentials don't exist or are invalid, authenticate
         if not self.credentials or not self.credentials.valid:
             if self.credentials and self.credentials.expired and self.credentials.refresh_token:
                 # Refresh expired credentials
+                from google.auth.transport.requests import Request
+
                 print("Refreshing expired credentials...")
                 self.credentials.refresh(Request())
             else:
                 # Perform OAuth2 flow
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 print("No valid credentials found. Starting authentication flow...")
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.client_secrets_file, SCOPES
@@ -76,13 +82,39 @@ class YouTubeAuthenticator:
                 )
 
             # Save credentials for future use
-            TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(TOKEN_FILE, 'wb') as token:
-                pickle.dump(self.credentials, token)
+            self._save_token()
             print("Credentials saved successfully.")
 
         return self.credentials
 
+    def _load_token(self) -> Optional["Credentials"]:
+        """
+        Load stored credentials, migrating a legacy pickle token to JSON.
+
+        Returns:
+            Stored credentials, or None if no token file exists
+        """
+        if TOKEN_FILE.exists():
+            from google.oauth2.credentials import Credentials
+
+            with open(TOKEN_FILE, 'r', encoding='utf-8') as token:
+                return Credentials.from_authorized_user_info(json.load(token), SCOPES)
+
+        if LEGACY_TOKEN_FILE.exists():
+            with open(LEGACY_TOKEN_FILE, 'rb') as token:
+                self.credentials = pickle.load(token)
+            self._save_token()
+            LEGACY_TOKEN_FILE.unlink()
+            return self.credentials
+
+        return None
+
+    def _save_token(self):
+        """Write the current credentials to the JSON token file."""
+        TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(TOKEN_FILE, 'w', encoding='utf-8') as token:
+            token.write(self.credentials.to_json())
+
     def get_youtube_service(self):
         """
         Get an authenticated YouTube API service.
@@ -90,14 +122,20 @@ class YouTubeAuthenticator:
         Returns:
             googleapiclient.discovery.Resource: YouTube API service object
         """
+        from googleapiclient.discovery import build
+
         if not self.credentials:
             self.authenticate()
 
-        return build('youtube', 'v3', credentials=self.credentials)
+        return build(
+            'youtube', 'v3', credentials=self.credentials,
+            cache_discovery=True, static_discovery=True
+        )
 
     def revoke_credentials(self):
         """Revoke credentials and delete the token file."""
-        if TOKEN_FILE.exists():
-            TOKEN_FILE.unlink()
+        if TOKEN_FILE.exists() or LEGACY_TOKEN_FILE.exists():
+            TOKEN_FILE.unlink(missing_ok=True)
+            LEGACY_TOKEN_FILE.unlink(missing_ok=True)
             print("Credentials revoked and token file deleted.")
         self.credentials = None
@@ -1,5 +1,5 @@
 """Bilibili client package for video operations."""
 
-from .client import BilibiliClient
+from .client import BilibiliAPIError, BilibiliClient, BilibiliVideo
 
-__all__ = ['BilibiliClient']
+__all__ = ['BilibiliAPIError', 'BilibiliClient', 'BilibiliVideo']
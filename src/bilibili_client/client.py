@@ -1,20 +1,244 @@
 """Bilibili API client for video operations."""
 
-import requests
-from typing import List, Dict, Optional
+import math
+import sqlite3
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from operator import itemgetter
+from pathlib import Path
+from threading import Lock
+from typing import Iterator, List, Dict, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+from src.utils import jsonio
+
+# Endpoints, with static query strings encoded once
+_ARCHIVES_PAGE_SIZE = 30
+_ARCHIVES_URL = 'https://member.bilibili.com/x/web/archives?' + urlencode({
+    'ps': _ARCHIVES_PAGE_SIZE,
+    'coop': 1,
+    'status': 'is_pubing,pubed,not_pubed',
+    'interactive': 1
+})
+_VIEW_URL = 'https://api.bilibili.com/x/web-interface/view'
+
+_get_tag_name = itemgetter('tag_name')
+
+# Per-request override for JSON POSTs; everything else comes from the session
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Messages for known video edit error codes; {message} is the API's own text
+_ERR_MSGS = {
+    -111: "CSRF verification failed. Please refresh your Bilibili cookies.",
+    21001: "Parameter error: {message}. API may require additional video part data.",
+    21011: "Video parts data required: {message}. Use manual sync for now.",
+    21015: "Video upload issue: {message}. Cannot edit without proper video data.",
+}
+
+
+class BilibiliAPIError(Exception):
+    """
+    A Bilibili API response with a non-zero code.
+
+    Attributes:
+        code: Bilibili error code (e.g. -111 for a failed CSRF check)
+        message: Error message returned by the API
+    """
+
+    def __init__(self, code: Optional[int], message: str, text: Optional[str] = None):
+        super().__init__(text or f"Bilibili API error (code {code}): {message}")
+        self.code = code
+        self.message = message
+
+
+@dataclass
+class BilibiliVideo:
+    """
+    A video from the user's archive listing.
+
+    Uses __slots__ to keep large channel listings compact, and supports
+    read-only mapping access (video['title'], 'tags' in video, video.get('tags'),
+    video.keys()) so it can be used wherever the listing's video dictionaries were.
+    """
+    __slots__ = (
+        'bvid', 'aid', 'title', 'description', 'tags', 'cover',
+        'duration', 'pubdate', 'state', 'typeid', 'copyright'
+    )
+
+    bvid: Optional[str]
+    aid: Optional[int]
+    title: Optional[str]
+    description: str
+    tags: List[str]
+    cover: Optional[str]
+    duration: Optional[int]
+    pubdate: Optional[int]
+    state: Optional[int]
+    typeid: Optional[int]
+    copyright: Optional[int]
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__slots__
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the field names, in listing order."""
+        return self.__slots__
+
+    def get(self, key: str, default=None):
+        """Return a field by name, or default if there is no such field."""
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self) -> Dict:
+        """Return the video as a plain dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def _intern(value):
+    """Intern a tag name that repeats across videos; missing (None) names pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _archive_to_video(archive: Dict) -> BilibiliVideo:
+    """Convert an 'Archive' record from the archives listing into a BilibiliVideo."""
+    get = archive.get
+    tag_str = get('tag') or ''
+    return BilibiliVideo(
+        bvid=get('bvid'),
+        aid=get('aid'),
+        title=get('title'),
+        description=get('desc', ''),
+        tags=list(map(sys.intern, tag_str.split(','))) if tag_str else [],
+        cover=get('cover'),
+        duration=get('duration'),
+        pubdate=get('pubdate'),
+        state=get('state'),
+        typeid=get('typeid'),
+        copyright=get('copyright')
+    )
+
+
+def _tag_names(tags) -> List[str]:
+    """Extract tag names from a view response's tag objects."""
+    tags = tags or ()
+    try:
+        return list(map(_intern, map(_get_tag_name, tags)))
+    except KeyError:
+        return [_intern(tag.get('tag_name')) for tag in tags]
+
+
+def _view_to_details(video_data: Dict) -> Dict:
+    """Convert a web-interface/view response body into a video details dict."""
+    get = video_data.get
+    return {
+        'bvid': get('bvid'),
+        'aid': get('aid'),
+        'title': get('title'),
+        'description': get('desc', ''),
+        'tags': _tag_names(get('tag')),
+        'cover': get('pic'),
+        'duration': get('duration'),
+        'pubdate': get('pubdate'),
+        'copyright': get('copyright'),
+        'typeid': get('tid')
+    }
+
+
+def _validate_metadata(title: str, tags: List[str]) -> Tuple[str, List[str]]:
+    """
+    Check a title and tag list against Bilibili's limits before any request is made.
+
+    Tags are stripped, and empty or duplicate tags are dropped (first occurrence wins).
+
+    Args:
+        title: Video title
+        tags: Tag list
+
+    Returns:
+        Tuple of (title, normalized tags)
+
+    Raises:
+        ValueError: If the title is over 80 characters or there are more than 10 tags
+    """
+    if len(title) > 80:
+        raise ValueError(f"Title too long: {len(title)} chars (max 80)")
+
+    tags = list(dict.fromkeys(tag for tag in map(str.strip, tags) if tag))
+    if len(tags) > 10:
+        raise ValueError(f"Too many tags: {len(tags)} (max 10)")
+
+    return title, tags
+
+
+class _RateLimiter:
+    """Adaptive request spacing: no delay until the API signals throttling."""
+
+    # Bilibili's "request blocked" / "too frequent" response codes
+    THROTTLE_CODES = (-412, -509)
+
+    def __init__(self, max_interval: float = 2.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_interval: Upper bound on the spacing between requests, in seconds
+        """
+        self.min_interval = 0.0
+        self.max_interval = max_interval
+        self._next_at = 0.0
+        self._lock = Lock()
+
+    def before(self):
+        """Wait until the next request may start."""
+        # Reserve the next slot under the lock, then sleep without holding it
+        # so concurrent callers wait in parallel rather than one at a time
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def after(self, throttled: bool):
+        """Back off exponentially after throttling, decay the spacing otherwise."""
+        with self._lock:
+            if throttled:
+                self.min_interval = min(self.max_interval, max(0.5, self.min_interval * 2))
+                self._next_at = max(self._next_at, time.monotonic() + self.min_interval)
+            else:
+                self.min_interval *= 0.9
 
 
 class BilibiliClient:
     """Client for interacting with Bilibili APIs."""
 
-    def __init__(self, sessdata: str, bili_jct: str):
+    def __init__(
+        self,
+        sessdata: str,
+        bili_jct: str,
+        cache_path: Optional[str] = None,
+        cache_ttl: int = 24 * 3600
+    ):
         """
         Initialize the Bilibili client.
 
         Args:
             sessdata: SESSDATA cookie value from Bilibili
             bili_jct: bili_jct cookie value (CSRF token)
+            cache_path: SQLite file for cached video details
+                (default: ~/.cache/bilibili_client/details.db)
+            cache_ttl: Seconds a cached video detail stays fresh (0 disables caching)
         """
         self.sessdata = sessdata
         self.bili_jct = bili_jct
@@ -27,83 +251,259 @@ class BilibiliClient:
             'Referer': 'https://member.bilibili.com/'
         }
 
+        # Persistent session: cookies/headers set once, keep-alive connection pool
+        self.session = requests.Session()
+        self.session.cookies.update(self.cookies)
+        self.session.headers.update(self.headers)
+        # Advertise every codec urllib3 can decode here: gzip/deflate always,
+        # br when brotli is installed (archive listings shrink well with it)
+        self.session.headers.update(make_headers(accept_encoding=True))
+        # 429 is left to _get_json_conditional, which backs the rate limiter off
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+        )
+        self.session.mount('https://', adapter)
+
+        # Adaptive spacing between requests; only slows down when throttled
+        self._rate_limiter = _RateLimiter()
+
+        # On-disk cache of video details keyed by aid
+        self.cache_ttl = cache_ttl
+        self._cache_lock = Lock()
+        self._cache = None
+        if cache_ttl > 0:
+            path = Path(cache_path) if cache_path else Path.home() / '.cache' / 'bilibili_client' / 'details.db'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(str(path), check_same_thread=False)
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS details (aid INTEGER PRIMARY KEY, json BLOB, ts INTEGER)'
+            )
+            # Archive listing pages, revalidated with their ETag on later runs
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS pages '
+                '(pn INTEGER, ps INTEGER, etag TEXT, json BLOB, ts INTEGER, PRIMARY KEY (pn, ps))'
+            )
+            self._cache.commit()
+
+    def _cache_get(self, aid: int) -> Optional[Dict]:
+        """Return cached details for an aid if present and fresh."""
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute('SELECT json, ts FROM details WHERE aid = ?', (aid,)).fetchone()
+        if row and time.time() - row[1] < self.cache_ttl:
+            return jsonio.loads(row[0])
+        return None
+
+    def _cache_set(self, aid: int, details: Dict):
+        """Store fetched details for an aid."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO details (aid, json, ts) VALUES (?, ?, ?)',
+                (aid, jsonio.dumpb(details), int(time.time()))
+            )
+            self._cache.commit()
+
+    def _page_cache_get(self, page_num: int) -> Optional[Tuple[str, Dict]]:
+        """Return the (etag, response body) cached for an archive listing page."""
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute(
+                'SELECT etag, json FROM pages WHERE pn = ? AND ps = ?', (page_num, _ARCHIVES_PAGE_SIZE)
+            ).fetchone()
+        if row:
+            return row[0], jsonio.loads(row[1])
+        return None
+
+    def _page_cache_set(self, page_num: int, etag: str, data: Dict):
+        """Store an archive listing page along with its ETag."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO pages (pn, ps, etag, json, ts) VALUES (?, ?, ?, ?, ?)',
+                (page_num, _ARCHIVES_PAGE_SIZE, etag, jsonio.dumpb(data), int(time.time()))
+            )
+            self._cache.commit()
+
+    def invalidate(self, aid: int):
+        """
+        Drop the cached details for a video.
+
+        Args:
+            aid: Video AV ID (numeric)
+        """
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute('DELETE FROM details WHERE aid = ?', (aid,))
+            self._cache.commit()
+
     def get_user_videos(self) -> List[Dict]:
         """
         Fetch all videos from the authenticated user's channel.
 
+        Use iter_user_videos() for the more compact BilibiliVideo records.
+
         Returns:
             List of video dictionaries with bvid, title, description, tags, etc.
 
         Raises:
             Exception: If unable to retrieve videos
         """
-        videos = []
-        page_num = 1
-        page_size = 30
+        videos = [video.to_dict() for video in self.iter_user_videos()]
+        print(f"Successfully fetched {len(videos)} videos from Bilibili.")
+        return videos
+
+    def iter_user_videos(self) -> Iterator[BilibiliVideo]:
+        """
+        Yield videos from the authenticated user's channel, page by page.
+
+        The first page is fetched on its own to learn the total video count;
+        the remaining pages are then fetched concurrently while earlier pages
+        are being consumed.
+
+        Yields:
+            Videos with bvid, title, description, tags, etc.
+
+        Raises:
+            Exception: If unable to retrieve videos
+        """
+        page_size = _ARCHIVES_PAGE_SIZE
 
         try:
-            while True:
-                # API endpoint for getting user's uploaded videos
-                url = 'https://member.bilibili.com/x/web/archives'
-                params = {
-                    'pn': page_num,
-                    'ps': page_size,
-                    'coop': 1,
-                    'status': 'is_pubing,pubed,not_pubed',
-                    'interactive': 1
-                }
-
-                response = requests.get(
-                    url,
-                    params=params,
-                    cookies=self.cookies,
-                    headers=self.headers,
-                    timeout=30
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                if data.get('code') != 0:
-                    raise Exception(f"Bilibili API error: {data.get('message', 'Unknown error')}")
-
-                page_data = data.get('data', {})
-                arc_audits = page_data.get('arc_audits', [])
-
-                if not arc_audits:
-                    break
-
-                for item in arc_audits:
-                    archive = item.get('Archive', {})
-                    video_info = {
-                        'bvid': archive.get('bvid'),
-                        'aid': archive.get('aid'),
-                        'title': archive.get('title'),
-                        'description': archive.get('desc', ''),
-                        'tags': archive.get('tag', '').split(',') if archive.get('tag') else [],
-                        'cover': archive.get('cover'),
-                        'duration': archive.get('duration'),
-                        'pubdate': archive.get('pubdate'),
-                        'state': archive.get('state'),
-                        'typeid': archive.get('typeid'),
-                        'copyright': archive.get('copyright')
-                    }
-                    videos.append(video_info)
-
-                # Check if we've reached the last page
-                if len(arc_audits) < page_size:
-                    break
-
-                page_num += 1
-                time.sleep(0.5)  # Rate limiting
-
-            print(f"Successfully fetched {len(videos)} videos from Bilibili.")
-            return videos
+            page_videos, page_info = self._fetch_page(1)
+            yield from page_videos
+            total = page_info.get('count')
+
+            if total is None:
+                # No page info in the response: walk pages until a short one
+                page_num = 1
+                while len(page_videos) == page_size:
+                    page_num += 1
+                    page_videos, _ = self._fetch_page(page_num)
+                    yield from page_videos
+            elif len(page_videos) == page_size:
+                num_pages = math.ceil(total / page_size)
+                executor = ThreadPoolExecutor(max_workers=4)
+                try:
+                    # map() yields results in page order
+                    for page_videos, _ in executor.map(self._fetch_page, range(2, num_pages + 1)):
+                        yield from page_videos
+                finally:
+                    # Don't keep fetching if the caller stops early
+                    executor.shutdown(cancel_futures=True)
 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Error fetching Bilibili videos: {e}")
         except Exception as e:
             raise Exception(f"Error processing Bilibili response: {e}")
 
+    def _get_json(self, url: str, max_attempts: int = 3) -> Dict:
+        """
+        GET a Bilibili API endpoint under the adaptive rate limiter.
+
+        Throttled responses (HTTP 429, codes -412/-509) slow the limiter down
+        and are retried; successful ones let it speed back up.
+
+        Args:
+            url: Endpoint URL, including its query string
+            max_attempts: Attempts before giving up on a throttled request
+
+        Returns:
+            Decoded response body (with code == 0)
+
+        Raises:
+            Exception: If the API returns an error code
+        """
+        return self._get_json_conditional(url, max_attempts=max_attempts)[0]
+
+    def _get_json_conditional(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        max_attempts: int = 3
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        GET a Bilibili API endpoint, revalidating a cached copy by ETag.
+
+        Args:
+            url: Endpoint URL, including its query string
+            etag: ETag of the cached response, sent as If-None-Match (optional)
+            max_attempts: Attempts before giving up on a throttled request
+
+        Returns:
+            Tuple of (decoded response body, or None if the server answered
+            304 Not Modified; the response's ETag, if any)
+
+        Raises:
+            Exception: If the API returns an error code
+        """
+        headers = {'If-None-Match': etag} if etag else None
+
+        for attempt in range(1, max_attempts + 1):
+            self._rate_limiter.before()
+            with self.session.get(url, timeout=30, stream=True, headers=headers) as response:
+                if response.status_code == 304:
+                    self._rate_limiter.after(False)
+                    return None, etag
+                if response.status_code == 429:
+                    data = {'code': -429, 'message': 'Too Many Requests'}
+                else:
+                    response.raise_for_status()
+                    data = jsonio.loads(self._read_body(response))
+
+            throttled = response.status_code == 429 or data.get('code') in _RateLimiter.THROTTLE_CODES
+            self._rate_limiter.after(throttled)
+            if throttled and attempt < max_attempts:
+                continue
+
+            if data.get('code') != 0:
+                message = data.get('message', 'Unknown error')
+                raise BilibiliAPIError(data.get('code'), message, f"Bilibili API error: {message}")
+            return data, response.headers.get('ETag')
+
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytearray:
+        """Read a streamed response body into a single growable buffer."""
+        buf = bytearray()
+        extend = buf.extend
+        for chunk in response.iter_content(chunk_size=65536):
+            extend(chunk)
+        return buf
+
+    def _fetch_page(self, page_num: int) -> Tuple[List[BilibiliVideo], Dict]:
+        """
+        Fetch one page of the user's uploaded videos.
+
+        Args:
+            page_num: 1-based page number
+
+        Returns:
+            Tuple of (videos on this page, page info with 'pn'/'ps'/'count')
+        """
+        # Unchanged pages come back as 304 and are served from the cache
+        cached = self._page_cache_get(page_num)
+        data, etag = self._get_json_conditional(
+            f"{_ARCHIVES_URL}&pn={page_num}", etag=cached[0] if cached else None
+        )
+        if data is None:
+            data = cached[1]
+        elif etag:
+            self._page_cache_set(page_num, etag, data)
+
+        page_data = data.get('data', {})
+        arc_audits = page_data.get('arc_audits') or []
+
+        videos = [_archive_to_video(item.get('Archive', {})) for item in arc_audits]
+
+        return videos, page_data.get('page') or {}
+
     def get_video_details(self, bvid: str) -> Dict:
         """
         Get detailed information for a specific video.
@@ -118,35 +518,9 @@ class BilibiliClient:
             Exception: If unable to retrieve video details
         """
         try:
-            url = 'https://api.bilibili.com/x/web-interface/view'
-            params = {'bvid': bvid}
-
-            response = requests.get(
-                url,
-                params=params,
-                cookies=self.cookies,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(f"{_VIEW_URL}?bvid={quote(bvid)}")
 
-            if data.get('code') != 0:
-                raise Exception(f"Bilibili API error: {data.get('message', 'Unknown error')}")
-
-            video_data = data.get('data', {})
-            return {
-                'bvid': video_data.get('bvid'),
-                'aid': video_data.get('aid'),
-                'title': video_data.get('title'),
-                'description': video_data.get('desc', ''),
-                'tags': [tag.get('tag_name') for tag in video_data.get('tag', [])],
-                'cover': video_data.get('pic'),
-                'duration': video_data.get('duration'),
-                'pubdate': video_data.get('pubdate'),
-                'copyright': video_data.get('copyright'),
-                'typeid': video_data.get('tid')
-            }
+            return _view_to_details(data.get('data', {}))
 
         except Exception as e:
             raise Exception(f"Error fetching video details for {bvid}: {e}")
@@ -159,7 +533,8 @@ class BilibiliClient:
         tags: List[str],
         cover: Optional[str] = None,
         typeid: Optional[int] = None,
-        copyright: Optional[int] = None
+        copyright: Optional[int] = None,
+        current: Optional[Dict] = None
     ) -> bool:
         """
         Update metadata for a video.
@@ -185,23 +560,27 @@ class BilibiliClient:
             cover: Cover image URL (optional)
             typeid: Category ID (optional)
             copyright: Copyright type: 1=original, 2=repost (optional)
+            current: Current video details, if already fetched (optional; should be
+                fetched with refresh=True, as its fields are sent back unchanged)
 
         Returns:
             True if successful
 
         Raises:
+            BilibiliAPIError: If the API rejects the update
             Exception: If update fails or API requirements not met
         """
         try:
-            # Validate inputs
-            if len(title) > 80:
-                raise ValueError(f"Title too long: {len(title)} chars (max 80)")
-
-            if len(tags) > 10:
-                raise ValueError(f"Too many tags: {len(tags)} (max 10)")
-
-            # Get current video info to fill missing fields
-            current = self.get_video_details_by_aid(aid)
+            # Validate inputs before any request
+            title, tags = _validate_metadata(title, tags)
+
+            # Get current video info only when a field must be filled from it;
+            # always from the API, so stale cached values are never written back
+            if current is None:
+                if typeid is None or cover is None or copyright is None:
+                    current = self.get_video_details_by_aid(aid, refresh=True)
+                else:
+                    current = {}
 
             # Correct endpoint (no /v2)
             url = 'https://member.bilibili.com/x/vu/web/edit'
@@ -213,49 +592,40 @@ class BilibiliClient:
                 'desc': description,
                 'tag': ','.join(tags),
                 'desc_format_id': 31,  # Required for proper formatting
-                'tid': typeid if typeid else current.get('typeid'),
-                'cover': cover if cover else current.get('cover'),
-                'copyright': copyright if copyright else current.get('copyright')
+                'tid': typeid if typeid is not None else current.get('typeid'),
+                'cover': cover if cover is not None else current.get('cover'),
+                'copyright': copyright if copyright is not None else current.get('copyright')
             }
 
             # CSRF must be query parameter, not in body
             url_with_csrf = f"{url}?csrf={self.bili_jct}"
 
             # Send as JSON (not form data)
-            headers = {
-                **self.headers,
-                'Content-Type': 'application/json'
-            }
-
-            response = requests.post(
+            response = self.session.post(
                 url_with_csrf,
-                json=payload,  # JSON payload, not data
-                cookies=self.cookies,
-                headers=headers,
+                data=jsonio.dumpb(payload),  # JSON payload, not form data
+                headers=_JSON_HEADERS,
                 timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = jsonio.loads(response.content)
 
             if data.get('code') != 0:
                 error_msg = data.get('message', 'Unknown error')
                 error_code = data.get('code')
+                template = _ERR_MSGS.get(error_code)
+                raise BilibiliAPIError(
+                    error_code, error_msg,
+                    template.format(message=error_msg) if template else None
+                )
 
-                # Common error codes
-                if error_code == -111:
-                    raise Exception(f"CSRF verification failed. Please refresh your Bilibili cookies.")
-                elif error_code == 21001:
-                    raise Exception(f"Parameter error: {error_msg}. API may require additional video part data.")
-                elif error_code == 21011:
-                    raise Exception(f"Video parts data required: {error_msg}. Use manual sync for now.")
-                elif error_code == 21015:
-                    raise Exception(f"Video upload issue: {error_msg}. Cannot edit without proper video data.")
-                else:
-                    raise Exception(f"Bilibili API error (code {error_code}): {error_msg}")
-
+            self.invalidate(aid)
             print(f"Successfully updated Bilibili video: {aid}")
             return True
 
+        except BilibiliAPIError:
+            # Keep the code available to callers (e.g. refresh cookies on -111)
+            raise
         except Exception as e:
             raise Exception(f"Error updating video metadata: {e}")
 
@@ -279,59 +649,117 @@ class BilibiliClient:
 
         Returns:
             Dictionary with formatted data ready for manual update
+
+        Raises:
+            ValueError: If the title or tags exceed Bilibili's limits
+        """
+        title, tags = _validate_metadata(title, tags)
+        current = self.get_video_details_by_aid(aid, refresh=True)
+        return self._format_update(aid, title, description, tags, current)
+
+    def generate_update_data_batch(
+        self,
+        items: List[Tuple[int, str, str, List[str]]]
+    ) -> List[Dict]:
         """
-        current = self.get_video_details_by_aid(aid)
+        Generate manual update data for many videos, fetching current details concurrently.
 
+        Args:
+            items: (aid, title, description, tags) tuples
+
+        Returns:
+            List of update data dictionaries, in the same order as items
+
+        Raises:
+            ValueError: If any item's title or tags exceed Bilibili's limits
+        """
+        validated = []
+        for aid, title, description, tags in items:
+            title, tags = _validate_metadata(title, tags)
+            validated.append((aid, title, description, tags))
+        items = validated
+
+        details = self.get_many_video_details([aid for aid, _, _, _ in items], refresh=True)
+
+        return [
+            self._format_update(
+                aid, title, description, tags,
+                details.get(aid) or self.get_video_details_by_aid(aid, refresh=True)
+            )
+            for aid, title, description, tags in items
+        ]
+
+    @staticmethod
+    def _format_update(aid: int, title: str, description: str, tags: List[str], current: Dict) -> Dict:
+        """Build the manual update dictionary from new metadata and current video details."""
         return {
             'bvid': current['bvid'],
             'aid': aid,
-            'title': title[:80],  # Bilibili max title length
+            'title': title,
             'description': description[:250] if len(description) > 250 else description,
-            'tags': ', '.join(tags[:10]),  # Bilibili max 10 tags
+            'tags': ', '.join(tags),
             'edit_link': f"https://member.bilibili.com/platform/upload/video/frame?aid={aid}",
             'view_link': f"https://www.bilibili.com/video/{current['bvid']}"
         }
 
-    def get_video_details_by_aid(self, aid: int) -> Dict:
+    def get_many_video_details(
+        self,
+        aids: List[int],
+        max_workers: int = 8,
+        refresh: bool = False
+    ) -> Dict[int, Dict]:
+        """
+        Fetch details for several videos concurrently.
+
+        Args:
+            aids: Video AV IDs (numeric)
+            max_workers: Maximum concurrent requests
+            refresh: Bypass the cache and fetch from the API (use before writing updates)
+
+        Returns:
+            Dictionary mapping aid to video metadata; aids that failed to
+            fetch are left out so callers can fall back to a single lookup
+        """
+        details = {}
+        if not aids:
+            return details
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.get_video_details_by_aid, aid, refresh): aid for aid in aids}
+            for future in as_completed(futures):
+                try:
+                    details[futures[future]] = future.result()
+                except Exception:
+                    continue
+
+        return details
+
+    def get_video_details_by_aid(self, aid: int, refresh: bool = False) -> Dict:
         """
         Get detailed information for a video by AID.
 
+        Results are served from the on-disk cache while fresh. Reads whose
+        values will be sent back in an update should pass refresh=True.
+
         Args:
             aid: Video AV ID (numeric)
+            refresh: Bypass the cache and fetch from the API (the result is still cached)
 
         Returns:
             Dictionary with video metadata
         """
+        if not refresh:
+            cached = self._cache_get(aid)
+            if cached is not None:
+                return cached
+
         try:
-            url = 'https://api.bilibili.com/x/web-interface/view'
-            params = {'aid': aid}
-
-            response = requests.get(
-                url,
-                params=params,
-                cookies=self.cookies,
-                headers=self.headers,
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(f"{_VIEW_URL}?aid={int(aid)}")
 
-            if data.get('code') != 0:
-                raise Exception(f"Bilibili API error: {data.get('message', 'Unknown error')}")
-
-            video_data = data.get('data', {})
-            return {
-                'bvid': video_data.get('bvid'),
-                'aid': video_data.get('aid'),
-                'title': video_data.get('title'),
-                'description': video_data.get('desc', ''),
-                'tags': [tag.get('tag_name') for tag in video_data.get('tag', [])],
-                'cover': video_data.get('pic'),
-                'duration': video_data.get('duration'),
-                'pubdate': video_data.get('pubdate'),
-                'copyright': video_data.get('copyright'),
-                'typeid': video_data.get('tid')
-            }
+            details = _view_to_details(data.get('data', {}))
 
         except Exception as e:
             raise Exception(f"Error fetching video details for aid {aid}: {e}")
+
+        self._cache_set(aid, details)
+        return details
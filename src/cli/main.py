@@ -3,10 +3,13 @@
 import os
 import sys
 import time
-import json
+import heapq
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+from queue import Queue
 from threading import Lock, Semaphore
 
 import click
@@ -14,6 +17,8 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from rich.progress import track
+from rich.live import Live
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -21,12 +26,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.auth.youtube_auth import YouTubeAuthenticator
 from src.youtube_client.client import YouTubeClient
-from src.seo_optimizer.optimizer import BilingualSEOOptimizer
+from src.seo_optimizer.cache import MetadataCache, metadata_key
 from src.tracking.video_tracker import VideoTracker
 from src.bilibili_client.client import BilibiliClient
-from src.analytics.tracker import AnalyticsTracker
-from src.analytics.reporter import AnalyticsReporter
-from src.analytics.html_generator import HTMLDashboardGenerator
+from src.utils import jsonio
+from src.utils.matching import match_by_title
+
+# The Claude SDK and the analytics modules are slow to import, so commands
+# import them when they need them
+if TYPE_CHECKING:
+    from src.seo_optimizer.optimizer import BilingualSEOOptimizer
 
 # Load environment variables
 load_dotenv()
@@ -39,6 +48,9 @@ class RateLimiter:
     Simple rate limiter using token bucket algorithm.
 
     Ensures API requests don't exceed specified rate limit (e.g., 50 requests per minute).
+    Up to max_requests calls may go through back to back; after that, callers are
+    spaced out at the refill rate. The lock only guards the bucket arithmetic, so
+    waiting threads sleep in parallel instead of queueing on the lock.
     """
 
     def __init__(self, max_requests: int, time_window: float):
@@ -51,31 +63,99 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.min_interval = time_window / max_requests  # Minimum seconds between requests
-        self.last_request_time = 0
+        self.capacity = float(max_requests)
+        self.rate = max_requests / time_window  # Tokens added per second
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
         self.lock = Lock()
 
     def acquire(self):
         """Wait if necessary to respect rate limit, then proceed."""
         with self.lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
 
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                time.sleep(sleep_time)
+            # Take a token; a negative balance reserves a slot behind earlier waiters
+            self.tokens -= 1
+            sleep_time = -self.tokens / self.rate if self.tokens < 0 else 0
 
-            self.last_request_time = time.time()
+        if sleep_time:
+            time.sleep(sleep_time)
 
 
 # Global rate limiter for Claude API (conservative: 40 RPM to stay under 50 RPM Tier 1 limit)
 claude_rate_limiter = RateLimiter(max_requests=40, time_window=60)
 
+# Descriptions compressed per Claude request in generate-bilibili-descriptions
+_COMPRESS_BATCH_SIZE = 10
+
+# Approved batch-update updates sent per YouTube batch request: the API maximum
+# with --auto-apply, a few at a time while reviewing so little is left waiting
+_AUTO_APPLY_UPDATE_BATCH_SIZE = 50
+_REVIEW_UPDATE_BATCH_SIZE = 5
+
+# UTF-16 high bytes outside U+4E00-U+9FFF, deleted when counting Chinese characters
+_NON_CJK_HIGH_BYTES = bytes(b for b in range(256) if not 0x4E <= b <= 0x9F)
+
+# Characters that end a sentence, for truncating at a sentence boundary
+_SENTENCE_ENDINGS = ('。', '！', '？', '.', '!', '?', '\n')
+
+# YouTube cache settings, set from the top-level CLI options
+youtube_cache_settings = {'cache_ttl': 3600, 'refresh_cache': False}
+
+# Bilibili video details cache settings, set from the top-level CLI options
+bilibili_cache_settings = {'cache_ttl': 24 * 3600}
+
+
+def _youtube_client(youtube_service) -> YouTubeClient:
+    """Create a YouTubeClient using the CLI's cache settings."""
+    return YouTubeClient(youtube_service, **youtube_cache_settings)
+
+
+@lru_cache(maxsize=None)
+def _bilibili_client(sessdata: str, bili_jct: str) -> BilibiliClient:
+    """Return the BilibiliClient (and its pooled session) for a set of credentials."""
+    return BilibiliClient(sessdata, bili_jct, **bilibili_cache_settings)
+
+
+def _load_match_file(match_path: Path) -> Dict:
+    """Load a match-bilibili results file."""
+    return jsonio.loads(match_path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _get_youtube_authenticator() -> YouTubeAuthenticator:
+    """Return the YouTube authenticator, created once per process."""
+    return YouTubeAuthenticator()
+
+
+@lru_cache(maxsize=1)
+def _get_youtube_service():
+    """Return the authenticated YouTube API service, built once per process."""
+    return _get_youtube_authenticator().get_youtube_service()
+
+
+@lru_cache(maxsize=None)
+def _seo_cache() -> MetadataCache:
+    """Return the on-disk cache of generated SEO metadata."""
+    return MetadataCache()
+
+
+@lru_cache(maxsize=1)
+def _get_optimizer() -> 'BilingualSEOOptimizer':
+    """Return the SEO optimizer shared by all commands, created on first use."""
+    from src.seo_optimizer.optimizer import BilingualSEOOptimizer
+    return BilingualSEOOptimizer(cache=_seo_cache())
+
 
 def _generate_seo_metadata(video: Dict, optimizer: 'BilingualSEOOptimizer') -> Optional[Dict]:
     """
     Generate SEO metadata for a single video (used for parallel processing).
 
+    Metadata already generated for the same title, description and tags is
+    reused from the cache without calling Claude.
+
     Args:
         video: Video dictionary with metadata
         optimizer: BilingualSEOOptimizer instance
@@ -83,26 +163,241 @@ def _generate_seo_metadata(video: Dict, optimizer: 'BilingualSEOOptimizer') -> O
     Returns:
         Dictionary with optimized metadata or None if failed
     """
+    cached = _seo_cache().get(video)
+    if cached is not None:
+        return cached
+
     try:
         # Respect rate limits before making API call
         claude_rate_limiter.acquire()
 
-        return optimizer.generate_metadata(
+        result = optimizer.generate_metadata(
             current_title=video['title'],
             current_description=video['description'],
             current_tags=video.get('tags', []),
             default_language=video.get('defaultLanguage'),
             default_audio_language=video.get('defaultAudioLanguage')
         )
+        _seo_cache().set(video, result)
+        return result
     except Exception as e:
         console.print(f"[red]Error generating metadata for {video['id']}: {e}[/red]")
         return None
 
 
+def _generate_seo_metadata_batch(videos: List[Dict], optimizer: 'BilingualSEOOptimizer') -> List[Optional[Dict]]:
+    """
+    Generate SEO metadata for a group of videos with a single Claude request.
+
+    Videos with cached metadata are left out of the request. Falls back to one
+    request per video if the batch request fails or leaves some videos out of
+    its response.
+
+    Args:
+        videos: Video dictionaries with metadata
+        optimizer: BilingualSEOOptimizer instance
+
+    Returns:
+        List of optimized metadata (None where generation failed), in the same order as videos
+    """
+    results = [_seo_cache().get(video) for video in videos]
+    uncached = [video for video, result in zip(videos, results) if result is None]
+
+    if len(uncached) > 1:
+        try:
+            claude_rate_limiter.acquire()
+            generated = iter(optimizer.generate_metadata_batch(uncached))
+        except Exception as e:
+            console.print(f"[yellow]Batch SEO generation failed ({e}), retrying videos one at a time[/yellow]")
+            generated = iter([None] * len(uncached))
+
+        for i, video in enumerate(videos):
+            if results[i] is None:
+                results[i] = next(generated)
+                if results[i] is not None:
+                    _seo_cache().set(video, results[i])
+
+    return [
+        result if result is not None else _generate_seo_metadata(video, optimizer)
+        for video, result in zip(videos, results)
+    ]
+
+
+def _compress_descriptions(items: List[Dict], optimizer: 'BilingualSEOOptimizer', max_length: int) -> Iterator[Optional[str]]:
+    """
+    Compress descriptions for Bilibili, several per Claude request.
+
+    Falls back to one request per description if a batch request fails or
+    leaves some descriptions out of its response. Results are yielded as
+    soon as they and every earlier one are ready, so callers can use them
+    while later batches are still being compressed.
+
+    Args:
+        items: Dictionaries with 'description' and 'title'
+        optimizer: BilingualSEOOptimizer instance
+        max_length: Bilibili description character limit
+
+    Yields:
+        Compressed descriptions (None where compression failed), in the same order as items
+    """
+    def compress_one(item):
+        try:
+            claude_rate_limiter.acquire()
+            return optimizer.compress_description_for_bilibili(
+                description=item['description'],
+                max_length=max_length,
+                video_title=item['title']
+            )
+        except Exception as e:
+            console.print(f"[red]Error compressing description for {item['title'][:50]}: {e}[/red]")
+            return None
+
+    # Descriptions that already fit are used as-is; only the rest go to Claude
+    results = [item['description'] if len(item['description']) <= max_length else None for item in items]
+    pending = [i for i, result in enumerate(results) if result is None]
+    # Once a batch is done, every result before the next batch's first
+    # description is final
+    batch_starts = pending[::_COMPRESS_BATCH_SIZE] + [len(items)]
+    yield from results[:batch_starts[0]]
+
+    for start in range(0, len(pending), _COMPRESS_BATCH_SIZE):
+        indices = pending[start:start + _COMPRESS_BATCH_SIZE]
+        chunk = [items[i] for i in indices]
+        try:
+            claude_rate_limiter.acquire()
+            compressed = optimizer.compress_descriptions_for_bilibili_batch(chunk, max_length)
+        except Exception as e:
+            console.print(f"[yellow]Batch compression failed ({e}), compressing descriptions one at a time[/yellow]")
+            compressed = [None] * len(chunk)
+
+        for i, item, text in zip(indices, chunk, compressed):
+            results[i] = text if text is not None else compress_one(item)
+
+        batch = start // _COMPRESS_BATCH_SIZE
+        yield from results[batch_starts[batch]:batch_starts[batch + 1]]
+
+
+def _compress_with_preview(
+    optimizer: 'BilingualSEOOptimizer',
+    description: str,
+    max_length: int,
+    video_title: str
+) -> str:
+    """
+    Compress a description for Bilibili, showing Claude's output as it is written.
+
+    Args:
+        optimizer: BilingualSEOOptimizer instance
+        description: Chinese section of the YouTube description
+        max_length: Bilibili description character limit
+        video_title: Video title for context
+
+    Returns:
+        Compressed description; the panel is left showing it for review
+    """
+    def preview(text):
+        return Panel(text, title="Bilibili description", border_style="cyan")
+
+    streamed = []
+    with Live(preview(""), console=console, refresh_per_second=8) as live:
+        def show(text):
+            streamed.append(text)
+            live.update(preview(''.join(streamed)))
+
+        compressed = optimizer.compress_description_for_bilibili(
+            description=description,
+            max_length=max_length,
+            video_title=video_title,
+            on_text=show
+        )
+        live.update(preview(compressed))
+
+    return compressed
+
+
+def _apply_pending_updates(
+    youtube_client: YouTubeClient,
+    tracker: 'VideoTracker',
+    pending_updates: List,
+    quiet: bool = False
+) -> int:
+    """
+    Send queued metadata updates to YouTube and track the ones that succeed.
+
+    Args:
+        youtube_client: YouTubeClient instance
+        tracker: VideoTracker instance
+        pending_updates: (video, optimized metadata) tuples; emptied once sent
+        quiet: Only report failures, not each successful update
+
+    Returns:
+        Number of videos updated successfully
+    """
+    if not pending_updates:
+        return 0
+
+    if not quiet:
+        console.print(f"[yellow]Updating metadata for {len(pending_updates)} video(s)...[/yellow]")
+    try:
+        results = youtube_client.update_videos_metadata([
+            {
+                'video_id': video['id'],
+                'title': optimized['title'],
+                'description': optimized['description'],
+                'tags': optimized['tags']
+            }
+            for video, optimized in pending_updates
+        ])
+    except Exception as e:
+        console.print(f"[red]Error updating videos: {e}[/red]")
+        results = {video['id']: e for video, _ in pending_updates}
+
+    updated_count = 0
+    for video, optimized in pending_updates:
+        # Only an explicit None result means the update went through
+        error = results.get(video['id'], Exception("No response received for this update"))
+        if error is not None:
+            console.print(f"[red]✗ Error updating {video['id']}: {error}[/red]")
+            continue
+
+        if not quiet:
+            console.print(f"[green]✓ Video updated successfully:[/green] {video['id']}")
+
+        # Mark as processed with full before/after metadata
+        tracker.mark_as_processed(
+            video_id=video['id'],
+            original_metadata={
+                'title': video['title'],
+                'description': video['description'],
+                'tags': video.get('tags', [])
+            },
+            optimized_metadata=optimized,
+            video_info={
+                'publishedAt': video.get('publishedAt'),
+                'duration': video.get('duration'),
+                'viewCount': video.get('viewCount'),
+                'likeCount': video.get('likeCount')
+            }
+        )
+        updated_count += 1
+
+    pending_updates.clear()
+    return updated_count
+
+
 @click.group()
-def cli():
+@click.option('--cache-ttl', default=3600, type=int, help='Seconds to reuse cached YouTube video data (default: 3600)')
+@click.option('--no-cache', is_flag=True, help='Do not cache YouTube or Bilibili video data (the Claude SEO cache is unaffected; use --cache-clear)')
+@click.option('--refresh-cache', is_flag=True, help='Ignore cached YouTube video data and fetch it again')
+@click.option('--bilibili-cache-ttl', default=24 * 3600, type=int, help='Seconds to reuse cached Bilibili video details (default: 86400, 0 disables)')
+@click.option('--cache-clear', is_flag=True, help='Discard cached Claude SEO suggestions and compressed descriptions so they are generated again')
+def cli(cache_ttl, no_cache, refresh_cache, bilibili_cache_ttl, cache_clear):
     """YouTube Manager - Optimize metadata, sync to Bilibili, and track analytics for your travel videos."""
-    pass
+    youtube_cache_settings['cache_ttl'] = 0 if no_cache else cache_ttl
+    youtube_cache_settings['refresh_cache'] = refresh_cache
+    bilibili_cache_settings['cache_ttl'] = 0 if no_cache else bilibili_cache_ttl
+    if cache_clear:
+        _seo_cache().clear()
 
 
 @cli.command()
@@ -111,7 +406,8 @@ def cli():
 @click.option('--auto-apply', is_flag=True, help='Automatically apply all changes without review')
 @click.option('--force', is_flag=True, help='Re-process already processed videos')
 @click.option('--parallel', default=3, type=int, help='Number of videos to generate SEO suggestions in parallel (default: 3, max recommended: 5)')
-def batch_update(limit, video_id, auto_apply, force, parallel):
+@click.option('--batch-size', default=5, type=int, help='Number of videos per Claude request (default: 5, max: 10, 1 = one request per video)')
+def batch_update(limit, video_id, auto_apply, force, parallel, batch_size):
     """
     Batch update metadata for existing videos on your channel.
 
@@ -133,49 +429,90 @@ def batch_update(limit, video_id, auto_apply, force, parallel):
 
         # Authenticate with YouTube
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
 
         # Initialize SEO optimizer
         console.print("[yellow]Initializing SEO optimizer...[/yellow]")
-        optimizer = BilingualSEOOptimizer()
+        optimizer = _get_optimizer()
+
+        # Generate suggestions on worker threads, starting on the first batches
+        # while the rest of the channel is still being listed
+        executor = ThreadPoolExecutor(max_workers=parallel)
+        try:
+            completed_batches = Queue()  # Finished batches, in the order they complete: (batch, Future)
+            batches = []  # Batches of videos, each covered by one Claude request
+            next_batch_idx = 0  # Index of next batch to submit
+
+            def submit_next_batch():
+                nonlocal next_batch_idx
+                if next_batch_idx < len(batches):
+                    batch = batches[next_batch_idx]
+                    future = executor.submit(_generate_seo_metadata_batch, batch, optimizer)
+                    future.add_done_callback(lambda f, batch=batch: completed_batches.put((batch, f)))
+                    next_batch_idx += 1
+
+            # Fetch videos
+            if video_id:
+                console.print(f"[yellow]Fetching video: {video_id}...[/yellow]")
+                channel_videos = [youtube_client.get_video_details(video_id)]
+            else:
+                console.print("[yellow]Fetching all videos from your channel...[/yellow]")
+                channel_videos = youtube_client.iter_all_channel_videos()
 
-        # Fetch videos
-        if video_id:
-            console.print(f"[yellow]Fetching video: {video_id}...[/yellow]")
-            videos = [youtube_client.get_video_details(video_id)]
-            total_videos = 1
-        else:
-            console.print("[yellow]Fetching all videos from your channel...[/yellow]")
-            videos = youtube_client.get_all_channel_videos()
-            total_videos = len(videos)
-
-        # Show tracking summary
-        tracked_count = tracker.get_processed_count()
-        optimized_count = tracker.get_optimized_count()
-        tool_generated_count = tracker.get_tool_generated_count()
-        unprocessed_count = total_videos - tracked_count
-
-        console.print(f"\n[cyan]Channel Summary:[/cyan]")
-        console.print(f"  Total videos: {total_videos}")
-        console.print(f"  Already optimized: {optimized_count}")
-        console.print(f"  Tool-generated (skipped): {tool_generated_count}")
-        console.print(f"  [bold]Not yet processed: {unprocessed_count}[/bold]\n")
-
-        # Filter out already processed videos (unless force flag is set)
-        if not force:
-            original_count = len(videos)
-
-            # Debug: Show which videos are being filtered
+            total_videos = 0
+            videos = []
             skipped_videos = []
-            for v in videos:
-                if tracker.is_processed(v['id']):
-                    skipped_videos.append((v['id'], v['title'][:50]))
 
-            videos = [v for v in videos if not tracker.is_processed(v['id'])]
-            skipped_count = original_count - len(videos)
+            # Videos with identical title, description and tags get identical suggestions,
+            # so only the first of each is sent to Claude: content key -> videos
+            duplicates = {}
+            unique_videos = []
+            from src.seo_optimizer.optimizer import MAX_METADATA_BATCH_SIZE
+            if batch_size > MAX_METADATA_BATCH_SIZE:
+                console.print(f"[dim]Using --batch-size {MAX_METADATA_BATCH_SIZE} (the most videos one Claude response has room for)[/dim]")
+            batch_size = min(max(1, batch_size), MAX_METADATA_BATCH_SIZE)
+
+            for video in channel_videos:
+                total_videos += 1
+
+                # Filter out already processed videos (unless force flag is set)
+                if not force and tracker.is_processed(video['id']):
+                    skipped_videos.append((video['id'], video['title'][:50]))
+                    continue
+                if limit and len(videos) >= limit:
+                    continue
+                videos.append(video)
 
+                key = metadata_key(video)
+                if key in duplicates:
+                    duplicates[key].append(video)
+                    continue
+                duplicates[key] = [video]
+                unique_videos.append(video)
+
+                # Start generating each full batch right away, up to `parallel` at a time
+                if len(unique_videos) % batch_size == 0:
+                    batches.append(unique_videos[-batch_size:])
+                    if next_batch_idx < parallel:
+                        submit_next_batch()
+
+            if len(unique_videos) % batch_size:
+                batches.append(unique_videos[-(len(unique_videos) % batch_size):])
+
+            # Show tracking summary
+            tracked_count = tracker.get_processed_count()
+            optimized_count = tracker.get_optimized_count()
+            tool_generated_count = tracker.get_tool_generated_count()
+            unprocessed_count = total_videos - tracked_count
+
+            console.print(f"\n[cyan]Channel Summary:[/cyan]")
+            console.print(f"  Total videos: {total_videos}")
+            console.print(f"  Already optimized: {optimized_count}")
+            console.print(f"  Tool-generated (skipped): {tool_generated_count}")
+            console.print(f"  [bold]Not yet processed: {unprocessed_count}[/bold]\n")
+
+            skipped_count = len(skipped_videos)
             if skipped_count > 0:
                 console.print(f"[yellow]Skipping {skipped_count} already tracked video(s).[/yellow]")
                 if skipped_count <= 5:  # Show details if not too many
@@ -183,123 +520,113 @@ def batch_update(limit, video_id, auto_apply, force, parallel):
                         console.print(f"[dim]  - {vid_id}: {title}...[/dim]")
                 console.print(f"[dim]Use --force to re-process them.[/dim]")
 
-        if limit:
-            videos = videos[:limit]
-
-        if len(videos) == 0:
-            console.print("[yellow]No videos to process. All videos already tracked.[/yellow]")
-            console.print("[dim]Use --force to re-process videos.[/dim]")
-            return
-
-        console.print(f"[green]Processing {len(videos)} video(s) in this run.[/green]")
-        if parallel > 1:
-            console.print(f"[cyan]Parallel mode: Pre-generating SEO suggestions for {parallel} videos at a time[/cyan]\n")
-        else:
-            console.print()
-
-        # Track successful updates in this run
-        processed_in_this_run = 0
-        user_quit = False
-
-        # Use parallel processing for SEO metadata generation
-        with ThreadPoolExecutor(max_workers=parallel) as executor:
-            # Map video_id -> Future for tracking
-            futures_map = {}
-
-            # Submit initial batch of tasks (pre-generate metadata for first N videos)
-            initial_batch_size = min(parallel, len(videos))
-            console.print(f"[dim]Pre-generating SEO suggestions for first {initial_batch_size} video(s)...[/dim]")
-
-            for i in range(initial_batch_size):
-                video = videos[i]
-                future = executor.submit(_generate_seo_metadata, video, optimizer)
-                futures_map[video['id']] = future
-
-            next_video_idx = initial_batch_size  # Index of next video to submit
-
-            # Process each video in order
-            for idx, video in enumerate(videos, 1):
-                console.print(f"\n[bold]Processing video {idx}/{len(videos)}[/bold]")
-                console.print(f"[cyan]Video ID:[/cyan] {video['id']}")
-                console.print(f"[cyan]Current Title:[/cyan] {video['title'][:80]}...")
-
-                # Debug: Check if already tracked
-                if tracker.is_processed(video['id']):
-                    console.print(f"[yellow]⚠ WARNING: This video ID is already in tracking file![/yellow]")
-                    console.print(f"[dim]This shouldn't happen - please report this issue.[/dim]")
-
-                # Get the pre-generated metadata (wait if not ready yet)
-                console.print("[yellow]Retrieving SEO-optimized metadata...[/yellow]")
-                try:
-                    future = futures_map[video['id']]
-                    optimized = future.result()  # Wait for result (should be instant if user took time reviewing)
-
-                    if optimized is None:
-                        console.print(f"[red]Failed to generate metadata for this video. Skipping.[/red]")
-                        continue
-
-                    # Submit next video's task to maintain the buffer
-                    if next_video_idx < len(videos):
-                        next_video = videos[next_video_idx]
-                        console.print(f"[dim]Pre-generating SEO suggestions for video {next_video_idx + 1}...[/dim]")
-                        new_future = executor.submit(_generate_seo_metadata, next_video, optimizer)
-                        futures_map[next_video['id']] = new_future
-                        next_video_idx += 1
-
-                    # Display comparison
-                    _display_comparison(video, optimized)
+            if len(videos) == 0:
+                console.print("[yellow]No videos to process. All videos already tracked.[/yellow]")
+                console.print("[dim]Use --force to re-process videos.[/dim]")
+                return
 
-                    # Ask for approval
+            console.print(f"[green]Processing {len(videos)} video(s) in this run.[/green]")
+            if parallel > 1:
+                console.print(f"[cyan]Parallel mode: Pre-generating SEO suggestions for {parallel} batch(es) of up to {batch_size} video(s) at a time[/cyan]\n")
+            else:
+                console.print()
+            if len(unique_videos) < len(videos):
+                console.print(f"[dim]{len(videos) - len(unique_videos)} video(s) share content with another video and reuse its suggestions[/dim]")
+
+            # Track successful updates in this run
+            processed_in_this_run = 0
+            user_quit = False
+
+            # Use parallel processing for SEO metadata generation
+            def iter_generated():
+                # Review batches as they complete, so one slow request doesn't hold up the rest
+                for _ in range(len(batches)):
+                    batch, future = completed_batches.get()
+
+                    # Keep `parallel` batches generating while this one is reviewed
+                    if next_batch_idx < len(batches):
+                        if not auto_apply:
+                            console.print(f"[dim]Pre-generating SEO suggestions for batch {next_batch_idx + 1}/{len(batches)}...[/dim]")
+                        submit_next_batch()
+
+                    for video, optimized in zip(batch, future.result()):
+                        for duplicate in duplicates[metadata_key(video)]:
+                            yield duplicate, optimized
+
+            # Submit any initial batches that were not already started while listing
+            initial_batch_count = min(parallel, len(batches))
+            console.print(f"[dim]Pre-generating SEO suggestions for first {initial_batch_count} batch(es)...[/dim]")
+
+            while next_batch_idx < initial_batch_count:
+                submit_next_batch()
+
+            # Approved updates waiting to be sent: (video, optimized metadata)
+            pending_updates = []
+
+            # Process each video as its SEO metadata becomes ready. With --auto-apply
+            # nothing needs reviewing, so only a progress bar is shown per video
+            generated = track(
+                iter_generated(), description="Updating videos...", total=len(videos),
+                console=console, disable=not auto_apply
+            )
+            update_batch_size = _AUTO_APPLY_UPDATE_BATCH_SIZE if auto_apply else _REVIEW_UPDATE_BATCH_SIZE
+            try:
+                for idx, (video, optimized) in enumerate(generated, 1):
                     if not auto_apply:
-                        choice = Prompt.ask(
-                            "\n[bold]Apply these changes?[/bold]",
-                            choices=["y", "n", "q"],
-                            default="n",
-                            show_choices=True
-                        )
-
-                        if choice == 'q':
-                            console.print("\n[yellow]Quitting batch update...[/yellow]")
-                            console.print(f"[cyan]Processed so far: {processed_in_this_run} video(s)[/cyan]")
-                            user_quit = True
-                            break
-                        elif choice == 'n':
-                            console.print("[yellow]Skipping this video.[/yellow]")
+                        console.print(f"\n[bold]Processing video {idx}/{len(videos)}[/bold]")
+                        console.print(f"[cyan]Video ID:[/cyan] {video['id']}")
+                        console.print(f"[cyan]Current Title:[/cyan] {video['title'][:80]}...")
+
+                        # Debug: Check if already tracked
+                        if tracker.is_processed(video['id']):
+                            console.print(f"[yellow]⚠ WARNING: This video ID is already in tracking file![/yellow]")
+                            console.print(f"[dim]This shouldn't happen - please report this issue.[/dim]")
+
+                    try:
+                        if optimized is None:
+                            console.print(f"[red]Failed to generate metadata for {video['id']}. Skipping.[/red]")
                             continue
 
-                    # Apply updates
-                    console.print("[yellow]Updating video metadata...[/yellow]")
-                    youtube_client.update_video_metadata(
-                        video_id=video['id'],
-                        title=optimized['title'],
-                        description=optimized['description'],
-                        tags=optimized['tags']
-                    )
-                    console.print("[green]✓ Video updated successfully![/green]")
-
-                    # Mark as processed with full before/after metadata
-                    tracker.mark_as_processed(
-                        video_id=video['id'],
-                        original_metadata={
-                            'title': video['title'],
-                            'description': video['description'],
-                            'tags': video.get('tags', [])
-                        },
-                        optimized_metadata=optimized,
-                        video_info={
-                            'publishedAt': video.get('publishedAt'),
-                            'duration': video.get('duration'),
-                            'viewCount': video.get('viewCount'),
-                            'likeCount': video.get('likeCount')
-                        }
-                    )
-
-                    # Increment current run counter
-                    processed_in_this_run += 1
-
-                except Exception as e:
-                    console.print(f"[red]Error processing video: {e}[/red]")
-                    continue
+                        # Display comparison and ask for approval
+                        if not auto_apply:
+                            _display_comparison(video, optimized)
+
+                            choice = Prompt.ask(
+                                "\n[bold]Apply these changes?[/bold]",
+                                choices=["y", "n", "q"],
+                                default="n",
+                                show_choices=True
+                            )
+
+                            if choice == 'q':
+                                console.print("\n[yellow]Quitting batch update...[/yellow]")
+                                processed_in_this_run += _apply_pending_updates(youtube_client, tracker, pending_updates)
+                                console.print(f"[cyan]Processed so far: {processed_in_this_run} video(s)[/cyan]")
+                                user_quit = True
+                                break
+                            elif choice == 'n':
+                                console.print("[yellow]Skipping this video.[/yellow]")
+                                continue
+
+                        # Queue the update; queued updates are sent together in batch requests
+                        pending_updates.append((video, optimized))
+                        if not auto_apply:
+                            console.print(f"[green]✓ Queued for update ({len(pending_updates)} pending)[/green]")
+
+                        if len(pending_updates) >= update_batch_size:
+                            processed_in_this_run += _apply_pending_updates(youtube_client, tracker, pending_updates, quiet=auto_apply)
+
+                    except Exception as e:
+                        console.print(f"[red]Error processing video {video['id']}: {e}[/red]")
+                        continue
+            finally:
+                # Send the rest of the approved updates, even if the review is
+                # interrupted (e.g. Ctrl-C) or fails
+                processed_in_this_run += _apply_pending_updates(youtube_client, tracker, pending_updates, quiet=auto_apply)
+        finally:
+            # Don't start queued Claude requests (or wait for running ones)
+            # if listing or review stops early
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Summary message
         if user_quit:
@@ -342,18 +669,21 @@ def mark_tool_generated(video_ids):
 
         # Authenticate with YouTube to get video titles
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
 
         # Process each video ID
         video_id_list = [vid.strip() for vid in video_ids.split(',')]
         marked_count = 0
 
+        # Fetch video details (up to 50 videos per request)
+        videos_by_id = youtube_client.get_videos_batch(video_id_list)
+
         for video_id in video_id_list:
             try:
-                # Fetch video details
-                video = youtube_client.get_video_details(video_id)
+                video = videos_by_id.get(video_id)
+                if video is None:
+                    raise Exception(f"Video not found: {video_id}")
 
                 # Mark as tool-generated
                 tracker.mark_as_tool_generated(
@@ -410,20 +740,24 @@ def backfill_metadata():
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
 
         # Authenticate with YouTube
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
+
+        # Fetch video details from YouTube API (up to 50 videos per request)
+        console.print(f"[cyan]Fetching metadata for {len(entries_needing_update)} video(s)...[/cyan]")
+        videos_by_id = youtube_client.get_videos_batch(entries_needing_update)
 
-        # Fetch and update each video
+        # Update each video
         updated_count = 0
         failed_count = 0
 
         for idx, video_id in enumerate(entries_needing_update, 1):
             try:
-                console.print(f"[cyan]Fetching metadata for video {idx}/{len(entries_needing_update)}:[/cyan] {video_id}")
+                console.print(f"[cyan]Updating metadata for video {idx}/{len(entries_needing_update)}:[/cyan] {video_id}")
 
-                # Fetch video details from YouTube API
-                video = youtube_client.get_video_details(video_id)
+                video = videos_by_id.get(video_id)
+                if video is None:
+                    raise Exception(f"Video not found: {video_id}")
 
                 # Update the entry with video_info
                 entry = tracker.processed_videos[video_id]
@@ -480,20 +814,19 @@ def match_bilibili(auto_match):
 
         # Authenticate with YouTube
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
 
         # Initialize Bilibili client
         console.print("[yellow]Authenticating with Bilibili...[/yellow]")
-        bilibili_client = BilibiliClient(sessdata, bili_jct)
+        bilibili_client = _bilibili_client(sessdata, bili_jct)
 
         # Fetch all videos
         console.print("[yellow]Fetching YouTube videos...[/yellow]")
         youtube_videos = youtube_client.get_all_channel_videos()
 
         console.print("[yellow]Fetching Bilibili videos...[/yellow]")
-        bilibili_videos = bilibili_client.get_user_videos()
+        bilibili_videos = list(bilibili_client.iter_user_videos())
 
         console.print(f"\n[cyan]Found {len(youtube_videos)} YouTube videos and {len(bilibili_videos)} Bilibili videos.[/cyan]\n")
 
@@ -501,15 +834,11 @@ def match_bilibili(auto_match):
         console.print("[yellow]Loading video tracking data for better matching...[/yellow]")
         tracker = VideoTracker()
 
-        # Match videos by title similarity
-        from difflib import SequenceMatcher
-
-        matches = []
-        matched_bili_ids = set()
+        # Use original title if video was optimized, otherwise use current title
+        match_titles = []
         using_original_count = 0
 
         for yt_video in youtube_videos:
-            # Use original title if video was optimized, otherwise use current title
             match_title = yt_video['title']
 
             if tracker.is_processed(yt_video['id']):
@@ -519,27 +848,19 @@ def match_bilibili(auto_match):
                     if original_title:
                         match_title = original_title
                         using_original_count += 1
-            best_match = None
-            best_ratio = 0
-
-            for bili_video in bilibili_videos:
-                if bili_video['bvid'] in matched_bili_ids:
-                    continue
-
-                # Calculate similarity ratio using original title for better matching
-                ratio = SequenceMatcher(None, match_title.lower(), bili_video['title'].lower()).ratio()
-
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = bili_video
-
-            if best_match and best_ratio >= 0.5:  # Threshold for considering a match
-                matches.append({
-                    'youtube': yt_video,
-                    'bilibili': best_match,
-                    'similarity': best_ratio
-                })
-                matched_bili_ids.add(best_match['bvid'])
+            match_titles.append(match_title)
+
+        # Match videos by title similarity (0.5 threshold for considering a match)
+        matches = [
+            {
+                'youtube': youtube_videos[yt_idx],
+                'bilibili': bilibili_videos[bili_idx],
+                'similarity': similarity
+            }
+            for yt_idx, bili_idx, similarity in match_by_title(
+                match_titles, [bili_video['title'] for bili_video in bilibili_videos]
+            )
+        ]
 
         # Display matches
         console.print(f"[dim]Used original titles for {using_original_count} optimized video(s)[/dim]")
@@ -579,7 +900,6 @@ def match_bilibili(auto_match):
             console.print(f"  [dim]YouTube ID: {yt['id']} | Bilibili BVID: {bili['bvid']}[/dim]\n")
 
         # Save matches to file
-        import json
         match_file = Path('bilibili_matches.json')
         match_data = {
             'matches': [
@@ -595,8 +915,7 @@ def match_bilibili(auto_match):
             ]
         }
 
-        with open(match_file, 'w', encoding='utf-8') as f:
-            json.dump(match_data, f, indent=2, ensure_ascii=False)
+        match_file.write_bytes(jsonio.dumpb(match_data, indent=True))
 
         console.print(f"[green]Matches saved to: {match_file.absolute()}[/green]")
         console.print("[dim]Use these matches with the 'sync-to-bilibili' command.[/dim]")
@@ -650,8 +969,7 @@ def sync_to_bilibili(match_file, min_confidence, auto_apply, youtube_id, desc_li
             console.print("[yellow]Run 'match-bilibili' command first to generate matches.[/yellow]")
             return
 
-        with open(match_path, 'r', encoding='utf-8') as f:
-            match_data = json.load(f)
+        match_data = _load_match_file(match_path)
 
         matches = match_data.get('matches', [])
 
@@ -672,13 +990,12 @@ def sync_to_bilibili(match_file, min_confidence, auto_apply, youtube_id, desc_li
 
         # Authenticate with YouTube
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
 
         # Initialize Bilibili client
         console.print("[yellow]Authenticating with Bilibili...[/yellow]")
-        bilibili_client = BilibiliClient(sessdata, bili_jct)
+        bilibili_client = _bilibili_client(sessdata, bili_jct)
 
         # Determine compression mode (LLM by default, simple truncation if flag is set)
         use_llm_compression = not simple_truncation
@@ -686,11 +1003,20 @@ def sync_to_bilibili(match_file, min_confidence, auto_apply, youtube_id, desc_li
 
         if use_llm_compression:
             console.print("[yellow]Initializing LLM compression (Claude API)...[/yellow]")
-            optimizer = BilingualSEOOptimizer()
+            optimizer = _get_optimizer()
             console.print("[cyan]Using intelligent LLM compression for descriptions (default)[/cyan]\n")
         else:
             console.print("[cyan]Using simple truncation for descriptions (--simple-truncation flag)[/cyan]\n")
 
+        # Prefetch current Bilibili details for all matches concurrently; these
+        # fields are sent back with each update, so never use cached copies
+        bilibili_details = bilibili_client.get_many_video_details(
+            [match['bilibili_aid'] for match in matches], refresh=True
+        )
+
+        # Prefetch current YouTube metadata (up to 50 videos per request)
+        youtube_videos = youtube_client.get_videos_batch([match['youtube_id'] for match in matches])
+
         synced_count = 0
 
         for idx, match in enumerate(matches, 1):
@@ -699,22 +1025,25 @@ def sync_to_bilibili(match_file, min_confidence, auto_apply, youtube_id, desc_li
             console.print(f"[magenta]Bilibili:[/magenta] {match['bilibili_title'][:60]}...")
 
             try:
-                # Fetch current YouTube metadata
-                yt_video = youtube_client.get_video_details(match['youtube_id'])
+                # Current YouTube metadata
+                yt_video = youtube_videos.get(match['youtube_id'])
+                if yt_video is None:
+                    raise Exception(f"Video not found: {match['youtube_id']}")
 
                 # Extract and compress Chinese section from description (for Bilibili)
                 description = yt_video['description']
 
                 if use_llm_compression:
-                    # Use LLM for intelligent compression
-                    console.print(f"  [dim]Compressing with LLM...[/dim]")
                     chinese_desc_raw, _ = _extract_chinese_section(description, max_length=999999)  # Extract first, don't truncate yet
-                    chinese_desc = optimizer.compress_description_for_bilibili(
-                        description=chinese_desc_raw,
-                        max_length=desc_limit,
-                        video_title=yt_video['title']
-                    )
                     was_truncated = len(chinese_desc_raw) > desc_limit
+
+                    if was_truncated:
+                        # Use LLM for intelligent compression
+                        console.print(f"  [dim]Compressing with LLM...[/dim]")
+                        chinese_desc = _compress_with_preview(optimizer, chinese_desc_raw, desc_limit, yt_video['title'])
+                    else:
+                        # Already fits, no LLM call needed
+                        chinese_desc = chinese_desc_raw
                 else:
                     # Use simple truncation
                     chinese_desc, was_truncated = _extract_chinese_section(description, max_length=desc_limit)
@@ -755,7 +1084,8 @@ def sync_to_bilibili(match_file, min_confidence, auto_apply, youtube_id, desc_li
                     aid=match['bilibili_aid'],
                     title=title,
                     description=chinese_desc,
-                    tags=tags
+                    tags=tags,
+                    current=bilibili_details.get(match['bilibili_aid'])
                 )
 
                 console.print("[green]✓ Synced successfully![/green]")
@@ -795,8 +1125,7 @@ def generate_bilibili_descriptions(match_file, min_confidence, desc_limit, outpu
             console.print(f"[red]Error: Match file not found: {match_file}[/red]")
             return
 
-        with open(match_path, 'r', encoding='utf-8') as f:
-            match_data = json.load(f)
+        match_data = _load_match_file(match_path)
 
         matches = match_data.get('matches', [])
         matches = [m for m in matches if m['similarity'] >= min_confidence]
@@ -805,66 +1134,86 @@ def generate_bilibili_descriptions(match_file, min_confidence, desc_limit, outpu
 
         # Initialize clients
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
-        youtube_client = YouTubeClient(youtube_service)
+        youtube_service = _get_youtube_service()
+        youtube_client = _youtube_client(youtube_service)
 
         console.print("[yellow]Initializing LLM compression...[/yellow]\n")
-        optimizer = BilingualSEOOptimizer()
+        optimizer = _get_optimizer()
 
-        # Generate compressed descriptions
-        results = []
+        # Fetch YouTube videos (up to 50 per request)
+        youtube_videos = youtube_client.get_videos_batch([match['youtube_id'] for match in matches])
+
+        # Extract the section to compress from each video
+        fetched = []  # (match, YouTube video, Chinese section)
         for idx, match in enumerate(matches, 1):
             console.print(f"[dim]Processing {idx}/{len(matches)}: {match['youtube_title'][:50]}...[/dim]")
 
             try:
-                # Fetch YouTube video
-                yt_video = youtube_client.get_video_details(match['youtube_id'])
+                yt_video = youtube_videos.get(match['youtube_id'])
+                if yt_video is None:
+                    raise Exception(f"Video not found: {match['youtube_id']}")
 
-                # Extract and compress
+                # Extract
                 description = yt_video['description']
                 chinese_desc_raw, _ = _extract_chinese_section(description, max_length=999999)
-                compressed_desc = optimizer.compress_description_for_bilibili(
-                    description=chinese_desc_raw,
-                    max_length=desc_limit,
-                    video_title=yt_video['title']
-                )
-
-                results.append({
-                    'match': match,
-                    'youtube_title': yt_video['title'],
-                    'compressed_desc': compressed_desc,
-                    'tags': ', '.join(yt_video.get('tags', [])[:10])
-                })
+                fetched.append((match, yt_video, chinese_desc_raw))
 
             except Exception as e:
                 console.print(f"  [red]Error: {e}[/red]")
                 continue
 
-        # Write to file
+        # Compress several descriptions per Claude request, writing each
+        # one to the output file as soon as it is ready
+        console.print(f"[yellow]Compressing {len(fetched)} description(s)...[/yellow]")
         output_path = Path(output)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("BILIBILI VIDEO DESCRIPTIONS (LLM COMPRESSED)\n")
-            f.write("Copy-paste these into Bilibili's web interface\n")
-            f.write("=" * 80 + "\n\n")
-
-            for idx, result in enumerate(results, 1):
-                match = result['match']
-                f.write(f"\n{'=' * 80}\n")
-                f.write(f"VIDEO {idx}/{len(results)}\n")
-                f.write(f"{'=' * 80}\n\n")
-                f.write(f"Bilibili Video: {match['bilibili_title']}\n")
-                f.write(f"Bilibili BVID: {match['bilibili_bvid']}\n")
-                f.write(f"Bilibili Link: https://www.bilibili.com/video/{match['bilibili_bvid']}\n\n")
-                f.write(f"YouTube Title (Reference):\n{result['youtube_title']}\n\n")
-                f.write(f"COMPRESSED DESCRIPTION ({len(result['compressed_desc'])} chars):\n")
-                f.write("-" * 80 + "\n")
-                f.write(result['compressed_desc'])
-                f.write("\n" + "-" * 80 + "\n\n")
-                f.write(f"TAGS:\n{result['tags']}\n\n")
-
-        console.print(f"\n[bold green]✓ Generated {len(results)} compressed descriptions![/bold green]")
+        rule = "=" * 80
+        divider = "-" * 80
+        count = 0
+        failed = 0
+        with open(output_path, 'w', encoding='utf-8', buffering=131072) as f:
+            f.write(
+                f"{rule}\n"
+                "BILIBILI VIDEO DESCRIPTIONS (LLM COMPRESSED)\n"
+                "Copy-paste these into Bilibili's web interface\n"
+                f"{rule}\n\n"
+            )
+
+            compressed_descs = _compress_descriptions(
+                [{'description': chinese_desc_raw, 'title': yt_video['title']} for _, yt_video, chinese_desc_raw in fetched],
+                optimizer,
+                desc_limit
+            )
+
+            # One write per video. Failed compressions are left out and counted in
+            # the closing summary, since the total isn't known until the end
+            for (match, yt_video, _), compressed_desc in zip(fetched, compressed_descs):
+                if compressed_desc is None:
+                    failed += 1
+                    continue
+                count += 1
+                tags = ', '.join(yt_video.get('tags', [])[:10])
+                f.write(
+                    f"\n{rule}\n"
+                    f"VIDEO {count}\n"
+                    f"{rule}\n\n"
+                    f"Bilibili Video: {match['bilibili_title']}\n"
+                    f"Bilibili BVID: {match['bilibili_bvid']}\n"
+                    f"Bilibili Link: https://www.bilibili.com/video/{match['bilibili_bvid']}\n\n"
+                    f"YouTube Title (Reference):\n{yt_video['title']}\n\n"
+                    f"COMPRESSED DESCRIPTION ({len(compressed_desc)} chars):\n"
+                    f"{divider}\n"
+                    f"{compressed_desc}"
+                    f"\n{divider}\n\n"
+                    f"TAGS:\n{tags}\n\n"
+                )
+                if count % _COMPRESS_BATCH_SIZE == 0:
+                    f.flush()
+
+            f.write(f"\n{rule}\n{count} written, {failed} failed\n{rule}\n")
+
+        console.print(f"\n[bold green]✓ Generated {count} compressed descriptions![/bold green]")
+        if failed:
+            console.print(f"[yellow]{failed} description(s) could not be compressed and were left out[/yellow]")
         console.print(f"[green]Output file: {output_path.absolute()}[/green]\n")
         console.print("[cyan]Instructions:[/cyan]")
         console.print("1. Open the output file")
@@ -878,6 +1227,19 @@ def generate_bilibili_descriptions(match_file, min_confidence, desc_limit, outpu
         sys.exit(1)
 
 
+def _count_chinese_chars(text: str) -> int:
+    """
+    Count the CJK ideographs (U+4E00-U+9FFF) in text.
+
+    A character is in that range exactly when the high byte of its UTF-16
+    code unit is 0x4E-0x9F (characters outside the BMP become surrogates,
+    0xD8-0xDF), so counting those bytes gives the answer without a
+    per-character Python loop.
+    """
+    return len(text.encode('utf-16-le')[1::2].translate(None, _NON_CJK_HIGH_BYTES))
+
+
+@lru_cache(maxsize=4096)
 def _extract_chinese_section(description: str, max_length: int = 250) -> tuple[str, bool]:
     """
     Extract the Chinese section from a bilingual description and truncate if needed.
@@ -893,22 +1255,22 @@ def _extract_chinese_section(description: str, max_length: int = 250) -> tuple[s
     separators = ['---', '___', '===']
     extracted = None
 
-    for sep in separators:
-        if sep in description:
-            sections = description.split(sep)
-            # Find the section with most Chinese characters
-            best_section = ""
-            max_chinese = 0
+    # Only the first separator present matters: the separators contain no
+    # Chinese, so if none of its sections has any, no other split would either
+    sep = next((s for s in separators if s in description), None)
+    if sep:
+        # Find the section with most Chinese characters
+        best_section = ""
+        max_chinese = 0
 
-            for section in sections:
-                chinese_count = len([c for c in section if '\u4e00' <= c <= '\u9fff'])
-                if chinese_count > max_chinese:
-                    max_chinese = chinese_count
-                    best_section = section.strip()
+        for section in description.split(sep):
+            chinese_count = _count_chinese_chars(section)
+            if chinese_count > max_chinese:
+                max_chinese = chinese_count
+                best_section = section.strip()
 
-            if best_section:
-                extracted = best_section
-                break
+        if best_section:
+            extracted = best_section
 
     # If no separator found, use the whole description
     if extracted is None:
@@ -921,17 +1283,11 @@ def _extract_chinese_section(description: str, max_length: int = 250) -> tuple[s
     # Smart truncation: try to break at sentence boundaries
     truncated = extracted[:max_length]
 
-    # Look for sentence endings (Chinese and English)
-    sentence_endings = ['。', '！', '？', '.', '!', '?', '\n']
-    best_break = -1
+    # Last sentence ending (Chinese or English) within the final 49 characters
+    search_start = max(0, len(truncated) - 50) + 1
+    best_break = max(truncated.rfind(ending, search_start) for ending in _SENTENCE_ENDINGS) + 1
 
-    # Search backwards from the truncation point for a good break point
-    for i in range(len(truncated) - 1, max(0, len(truncated) - 50), -1):
-        if truncated[i] in sentence_endings:
-            best_break = i + 1
-            break
-
-    # If found a good break point within last 50 chars, use it
+    # If found a good break point near the end, use it
     if best_break > 0:
         truncated = truncated[:best_break].strip()
     else:
@@ -958,7 +1314,7 @@ def new_video(topic, locations, key_points, save):
     try:
         # Initialize SEO optimizer
         console.print("[yellow]Initializing SEO optimizer...[/yellow]")
-        optimizer = BilingualSEOOptimizer()
+        optimizer = _get_optimizer()
 
         # Generate metadata
         console.print("[yellow]Generating SEO-optimized metadata...[/yellow]\n")
@@ -1046,7 +1402,8 @@ def _save_metadata(metadata, filepath):
 @click.option('--save-snapshot', is_flag=True, help='Save a snapshot of current analytics')
 @click.option('--html', is_flag=True, help='Generate HTML dashboard report (opens in browser)')
 @click.option('--html-output', default=None, help='Custom filename for HTML report')
-def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, html_output):
+@click.option('--compress', is_flag=True, help='Save the HTML report gzip-compressed (.html.gz); not opened in the browser')
+def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, html_output, compress):
     """
     Display comprehensive analytics dashboard for your YouTube channel.
 
@@ -1065,36 +1422,29 @@ def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, htm
     try:
         # Authenticate with YouTube
         console.print("[yellow]Authenticating with YouTube...[/yellow]")
-        auth = YouTubeAuthenticator()
-        youtube_service = auth.get_youtube_service()
+        youtube_service = _get_youtube_service()
 
         # Initialize analytics tracker
         console.print("[yellow]Initializing analytics tracker...[/yellow]")
-        tracker = AnalyticsTracker(youtube_service)
+        from src.analytics.tracker import AnalyticsTracker
+        tracker = AnalyticsTracker(youtube_service, _get_youtube_authenticator().credentials)
 
-        # Fetch channel analytics
+        # Fetch channel and video analytics concurrently
         console.print(f"[yellow]Fetching channel analytics (last {days} days)...[/yellow]")
-        channel_data = tracker.fetch_channel_analytics(days=days)
-
-        # Fetch video analytics
         console.print(f"[yellow]Fetching video analytics (last {video_limit} videos)...[/yellow]")
-        videos_data = tracker.fetch_video_analytics(limit=video_limit)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            channel_future = executor.submit(tracker.fetch_channel_analytics, days=days)
+            videos_data = tracker.fetch_video_analytics(limit=video_limit)
+            channel_data = channel_future.result()
 
         console.print(f"[green]✓ Fetched data for {len(videos_data)} videos[/green]\n")
 
-        # Filter videos to only those published in the specified time period for "recent performance"
+        # Filter videos to only those published in the specified time period for "recent performance".
+        # YouTube timestamps are UTC ISO 8601 strings, which sort in time order, so no parsing is needed
+        # (missing dates are '' and never pass)
         from datetime import datetime, timedelta, timezone
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-        recent_videos = []
-        for video in videos_data:
-            try:
-                # Parse ISO format date string
-                pub_date = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
-                if pub_date >= cutoff_date:
-                    recent_videos.append(video)
-            except (ValueError, KeyError):
-                # Skip videos with invalid dates
-                continue
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        recent_videos = [video for video in videos_data if video.get('published_at', '') >= cutoff]
 
         console.print(f"[dim]Found {len(recent_videos)} video(s) published in last {days} days[/dim]\n")
 
@@ -1102,7 +1452,7 @@ def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, htm
         if save_snapshot:
             console.print("[yellow]Saving analytics snapshot...[/yellow]")
             tracker.save_snapshot(channel_data, videos_data)
-            console.print(f"[green]✓ Snapshot saved to: {tracker.analytics_file.absolute()}[/green]\n")
+            console.print(f"[green]✓ Snapshot saved to: {tracker.data_dir.absolute()}[/green]\n")
 
         # Calculate growth metrics
         console.print(f"[yellow]Calculating growth metrics (last {growth_days} days)...[/yellow]")
@@ -1119,19 +1469,21 @@ def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, htm
         top_videos = tracker.get_top_performing_videos(metric='views', limit=10)
         if not top_videos:
             # Use current videos data if no history
-            top_videos = sorted(videos_data, key=lambda x: x['views'], reverse=True)[:10]
+            top_videos = heapq.nlargest(10, videos_data, key=itemgetter('views'))
 
         # Get underperforming videos
         underperforming = tracker.get_underperforming_videos(threshold_percentile=25, limit=5)
         if not underperforming:
             # Use current videos data if no history
             if len(videos_data) >= 4:
-                sorted_videos = sorted(videos_data, key=lambda x: x['views'])
-                underperforming = sorted_videos[:min(5, len(sorted_videos) // 4)]
+                underperforming = heapq.nsmallest(
+                    min(5, len(videos_data) // 4), videos_data, key=itemgetter('views')
+                )
 
         # Generate HTML dashboard if requested
         if html:
             console.print("\n[yellow]Generating HTML dashboard...[/yellow]")
+            from src.analytics.html_generator import HTMLDashboardGenerator
             html_generator = HTMLDashboardGenerator()
             html_file = html_generator.generate_dashboard(
                 channel_data=channel_data,
@@ -1139,19 +1491,25 @@ def analytics_dashboard(days, video_limit, growth_days, save_snapshot, html, htm
                 growth_metrics=growth_metrics,
                 top_videos=top_videos,
                 underperforming=underperforming,
-                output_file=html_output
+                output_file=html_output,
+                compress=compress
             )
             console.print(f"[green]✓ HTML dashboard saved to: {html_file}[/green]")
 
-            # Try to open in browser
-            import webbrowser
-            try:
-                webbrowser.open(f'file://{html_file}')
-                console.print("[green]✓ Opening dashboard in your browser...[/green]\n")
-            except:
-                console.print(f"[yellow]Open the file manually: {html_file}[/yellow]\n")
+            # Browsers download .gz files instead of showing them
+            if html_file.endswith('.gz'):
+                console.print(f"[dim]Compressed report; decompress it (e.g. gunzip -k {html_file}) to view it in a browser.[/dim]\n")
+            else:
+                # Try to open in browser
+                import webbrowser
+                try:
+                    webbrowser.open(f'file://{html_file}')
+                    console.print("[green]✓ Opening dashboard in your browser...[/green]\n")
+                except:
+                    console.print(f"[yellow]Open the file manually: {html_file}[/yellow]\n")
         else:
             # Generate and display terminal dashboard
+            from src.analytics.reporter import AnalyticsReporter
             reporter = AnalyticsReporter()
             reporter.generate_dashboard_report(
                 channel_data=channel_data,
@@ -0,0 +1,107 @@
+"""On-disk cache of Claude-generated text, keyed by the content it was generated from."""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+
+def metadata_key(video: Dict) -> str:
+    """
+    Hash the fields that determine the generated metadata for a video.
+
+    Args:
+        video: Video dictionary with title, description, tags and language settings
+
+    Returns:
+        Hex digest identifying the video's content
+    """
+    parts = [
+        video['title'],
+        video['description'],
+        ','.join(sorted(video.get('tags') or [])),
+        video.get('defaultLanguage') or '',
+        video.get('defaultAudioLanguage') or '',
+    ]
+    return hashlib.blake2b('\x00'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def compression_key(description: str, max_length: int, video_title: Optional[str] = None) -> str:
+    """
+    Hash the inputs that determine a compressed Bilibili description.
+
+    Args:
+        description: Description to compress
+        max_length: Character limit it is compressed to
+        video_title: Video title given as context, if any
+
+    Returns:
+        Hex digest identifying the compression request
+    """
+    parts = [description, str(max_length), video_title or '']
+    return hashlib.blake2b('\x00'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class MetadataCache:
+    """Content-addressed SQLite cache of Claude-generated video metadata and descriptions."""
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Open (or create) the metadata cache.
+
+        Args:
+            cache_path: SQLite file for cached metadata
+                (default: ~/.cache/seo_optimizer/metadata.db)
+        """
+        path = Path(cache_path) if cache_path else Path.home() / '.cache' / 'seo_optimizer' / 'metadata.db'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, json TEXT, ts INTEGER)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS compressions (key TEXT PRIMARY KEY, text TEXT, ts INTEGER)')
+        self._db.commit()
+
+    def get(self, video: Dict) -> Optional[Dict]:
+        """Return the metadata previously generated for this video content, if any."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT json FROM metadata WHERE key = ?', (metadata_key(video),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, video: Dict, metadata: Dict):
+        """Store metadata generated for this video content."""
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO metadata (key, json, ts) VALUES (?, ?, ?)',
+                (metadata_key(video), json.dumps(metadata, ensure_ascii=False), int(time.time()))
+            )
+            self._db.commit()
+
+    def get_compression(self, description: str, max_length: int, video_title: Optional[str] = None) -> Optional[str]:
+        """Return the description previously compressed from these inputs, if any."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT text FROM compressions WHERE key = ?',
+                (compression_key(description, max_length, video_title),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_compression(self, description: str, max_length: int, video_title: Optional[str], compressed: str):
+        """Store a description compressed by Claude."""
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO compressions (key, text, ts) VALUES (?, ?, ?)',
+                (compression_key(description, max_length, video_title), compressed, int(time.time()))
+            )
+            self._db.commit()
+
+    def clear(self):
+        """Remove all cached metadata and descriptions."""
+        with self._lock:
+            self._db.execute('DELETE FROM metadata')
+            self._db.execute('DELETE FROM compressions')
+            self._db.commit()
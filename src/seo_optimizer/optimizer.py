@@ -2,27 +2,87 @@
 
 import os
 import re
-from typing import Dict, Optional
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
 from anthropic import Anthropic
 
+from .cache import MetadataCache
+
+# Runs of CJK ideographs / ASCII letters; counting per run needs one match per word, not per character
+_CJK_RUNS = re.compile(r'[\u4e00-\u9fff]+')
+_LATIN_RUNS = re.compile(r'[a-zA-Z]+')
+
+
+def _count_chars(runs: re.Pattern, text: str) -> int:
+    """Count the characters of text matched by a run pattern."""
+    return sum(map(len, runs.findall(text)))
+
+
+# Output token budget for one request. The SDK refuses non-streaming requests
+# that could run past its 10 minute timeout (about 21K output tokens), well
+# below the model's own output limit
+_MAX_OUTPUT_TOKENS = 20480
+
+# Output tokens allowed per video in generate_metadata_batch(), and so the
+# most videos one batch request can hold
+_METADATA_TOKENS_PER_VIDEO = 2048
+MAX_METADATA_BATCH_SIZE = _MAX_OUTPUT_TOKENS // _METADATA_TOKENS_PER_VIDEO
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a Markdown code fence (with or without a json tag) around a response."""
+    if text.startswith('```'):
+        lines = text.split('\n')
+        text = '\n'.join(lines[1:-1]) if len(lines) > 2 else text
+        if text.startswith('json'):
+            text = text[4:].strip()
+    return text
+
+
+# Claude clients shared by every optimizer using the same API key, so their
+# pooled keep-alive connections (and TLS sessions) are reused across instances
+_clients: Dict[str, Anthropic] = {}
+_clients_lock = Lock()
+
+
+def _shared_client(api_key: str) -> Anthropic:
+    """Return the process-wide Claude client for an API key, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = Anthropic(api_key=api_key)
+        return client
+
 
 class BilingualSEOOptimizer:
     """Generates SEO-optimized bilingual metadata for travel videos."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[Anthropic] = None,
+        cache: Optional[MetadataCache] = None
+    ):
         """
         Initialize the SEO optimizer.
 
         Args:
             api_key: Anthropic API key (if None, reads from ANTHROPIC_API_KEY env var)
+            client: Claude client to use (if None, shares one client per API key)
+            cache: Cache for compressed descriptions (if None, nothing is cached)
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        self.cache = cache
+        if client is not None:
+            self.client = client
+            return
+
         if not self.api_key:
             raise ValueError(
                 "Anthropic API key not found. Set ANTHROPIC_API_KEY environment variable "
                 "or pass it to the constructor."
             )
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = _shared_client(self.api_key)
 
     def _detect_primary_language(
         self,
@@ -61,8 +121,8 @@ class BilingualSEOOptimizer:
                     return 'english'
 
         # Priority 2: Analyze title characters (title is most indicative)
-        title_chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', title))
-        title_english_chars = len(re.findall(r'[a-zA-Z]', title))
+        title_chinese_chars = _count_chars(_CJK_RUNS, title)
+        title_english_chars = _count_chars(_LATIN_RUNS, title)
 
         # If title has substantial Chinese content, it's a Chinese video
         if title_chinese_chars > 5:  # At least 5 Chinese characters
@@ -73,52 +133,23 @@ class BilingualSEOOptimizer:
         if title_total > 0 and title_english_chars / title_total > 0.7:
             return 'english'
 
-        # Priority 3: Fallback to description analysis
-        combined_text = title + " " + description
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', combined_text))
-        english_chars = len(re.findall(r'[a-zA-Z]', combined_text))
+        # Priority 3: Fallback to description analysis (title counts are reused)
+        chinese_chars = title_chinese_chars + _count_chars(_CJK_RUNS, description)
+        english_chars = title_english_chars + _count_chars(_LATIN_RUNS, description)
 
         # Primary language is the one with more characters
         return 'chinese' if chinese_chars > english_chars else 'english'
 
-    def generate_metadata(
-        self,
-        current_title: str,
-        current_description: str,
-        current_tags: list = None,
-        video_context: Optional[str] = None,
-        default_language: Optional[str] = None,
-        default_audio_language: Optional[str] = None
-    ) -> Dict[str, any]:
+    def _language_instructions(self, primary_lang: str) -> Tuple[str, str]:
         """
-        Generate SEO-optimized bilingual metadata for a travel video.
+        Get the title/description instructions and example hashtags for a primary language.
 
         Args:
-            current_title: Current video title (in Chinese)
-            current_description: Current video description
-            current_tags: Current tags (if any)
-            video_context: Additional context about the video content
+            primary_lang: 'chinese' or 'english'
 
         Returns:
-            Dictionary with optimized metadata:
-            {
-                'title': str,           # Optimized Chinese title
-                'description': str,     # Bilingual description (Chinese + English)
-                'tags': list,          # Mix of Chinese and English tags
-                'hashtags': list       # Bilingual hashtags
-            }
+            Tuple of (title and description instructions, example hashtags)
         """
-        current_tags_str = ', '.join(current_tags) if current_tags else 'None'
-
-        # Detect primary language using all available signals
-        primary_lang = self._detect_primary_language(
-            current_title,
-            current_description,
-            default_language,
-            default_audio_language
-        )
-
-        # Build language-specific prompt
         if primary_lang == 'chinese':
             lang_instruction = """**1. TITLE (MUST be in Chinese)**
 - CRITICAL: The title MUST be in Chinese. DO NOT translate to English.
@@ -211,6 +242,48 @@ Structure:
 ```"""
             example_hashtags = "#PersonalGrowth #读书 #Productivity #ReadingChallenge #自我提升"
 
+        return lang_instruction, example_hashtags
+
+    def generate_metadata(
+        self,
+        current_title: str,
+        current_description: str,
+        current_tags: list = None,
+        video_context: Optional[str] = None,
+        default_language: Optional[str] = None,
+        default_audio_language: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Generate SEO-optimized bilingual metadata for a travel video.
+
+        Args:
+            current_title: Current video title (in Chinese)
+            current_description: Current video description
+            current_tags: Current tags (if any)
+            video_context: Additional context about the video content
+
+        Returns:
+            Dictionary with optimized metadata:
+            {
+                'title': str,           # Optimized Chinese title
+                'description': str,     # Bilingual description (Chinese + English)
+                'tags': list,          # Mix of Chinese and English tags
+                'hashtags': list       # Bilingual hashtags
+            }
+        """
+        current_tags_str = ', '.join(current_tags) if current_tags else 'None'
+
+        # Detect primary language using all available signals
+        primary_lang = self._detect_primary_language(
+            current_title,
+            current_description,
+            default_language,
+            default_audio_language
+        )
+
+        # Build language-specific prompt
+        lang_instruction, example_hashtags = self._language_instructions(primary_lang)
+
         prompt = f"""You are an expert in YouTube SEO. Your task is to optimize metadata for this video to improve discoverability for both primary and secondary language audiences.
 
 **Current Video Information:**
@@ -275,11 +348,7 @@ Please generate the optimized metadata now. Return ONLY the JSON output, nothing
             response_text = response.content[0].text.strip()
 
             # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1]) if len(lines) > 2 else response_text
-                if response_text.startswith('json'):
-                    response_text = response_text[4:].strip()
+            response_text = _strip_code_fence(response_text)
 
             # Parse JSON
             import json
@@ -290,6 +359,136 @@ Please generate the optimized metadata now. Return ONLY the JSON output, nothing
         except Exception as e:
             raise Exception(f"Error generating metadata with Claude API: {e}")
 
+    def generate_metadata_batch(self, videos: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Generate SEO-optimized bilingual metadata for several videos in one Claude request.
+
+        Args:
+            videos: Video dictionaries with 'title', 'description' and optionally
+                'tags', 'defaultLanguage' and 'defaultAudioLanguage' (at most
+                MAX_METADATA_BATCH_SIZE; larger batches may be cut off mid-response)
+
+        Returns:
+            List of metadata dictionaries (same shape as generate_metadata()), in the
+            same order as videos; None for any video missing from the response
+        """
+        video_sections = []
+        languages = {}
+        for number, video in enumerate(videos, 1):
+            primary_lang = self._detect_primary_language(
+                video['title'],
+                video['description'],
+                video.get('defaultLanguage'),
+                video.get('defaultAudioLanguage')
+            )
+            if primary_lang not in languages:
+                languages[primary_lang] = self._language_instructions(primary_lang)
+
+            current_tags = video.get('tags')
+            video_sections.append(f"""### Video {number} (primary language: {primary_lang.capitalize()})
+- Title: {video['title']}
+- Description: {video['description']}
+- Current Tags: {', '.join(current_tags) if current_tags else 'None'}""")
+
+        videos_str = '\n\n'.join(video_sections)
+        instructions_str = '\n\n'.join(
+            f"#### For {lang.capitalize()} videos\n\n{lang_instruction}\n\n"
+            f"Example hashtags: {example_hashtags}"
+            for lang, (lang_instruction, example_hashtags) in languages.items()
+        )
+
+        prompt = f"""You are an expert in YouTube SEO. Your task is to optimize metadata for each of the following {len(videos)} videos to improve discoverability for both primary and secondary language audiences.
+
+**Current Video Information:**
+
+{videos_str}
+
+**CRITICAL: Content Preservation**
+The current descriptions may contain important information such as:
+- Music credits and attributions (e.g., "Music: [song name] by [artist]")
+- Timestamps and chapter markers (e.g., "0:00 Intro", "2:30 Main content")
+- Social media links and handles
+- Equipment/gear information
+- Location details
+- External links and resources
+
+YOU MUST PRESERVE ALL OF THIS INFORMATION in each optimized description. Do not remove or omit any credits, timestamps, links, or metadata that exists in the current description.
+
+**Your Task:**
+Generate SEO-optimized metadata for EACH video separately, following the requirements for that video's primary language:
+
+{instructions_str}
+
+**3. TAGS (8-12 tags per video, mixed Chinese & English)**
+- First tag should be the most relevant keyword
+- Mix of Chinese and English tags appropriate to the content
+- Topic-specific tags in both languages
+- Balance between broad and niche keywords
+
+**4. HASHTAGS (3-5 bilingual hashtags per video)**
+- First 3 hashtags will appear above video title (most visible)
+- Mix of broad reach and niche specificity
+- Bilingual approach for maximum discoverability
+- Focused on main keywords and topics
+- Avoid generic tags like #video or #youtube
+
+**Output Format (JSON array, one object per video, in the same order):**
+```json
+[
+  {{
+    "video": 1,
+    "title": "optimized title in original language",
+    "description": "Primary language section\\n\\n---\\n\\nSecondary language section",
+    "tags": ["tag1", "tag2", "tag3", ...],
+    "hashtags": ["#hashtag1", "#hashtag2", "#hashtag3", "#hashtag4", "#hashtag5"]
+  }},
+  ...
+]
+```
+
+Please generate the optimized metadata for all {len(videos)} videos now. Return ONLY the JSON array, nothing else."""
+
+        try:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-5-20250929",
+                max_tokens=min(_METADATA_TOKENS_PER_VIDEO * len(videos), _MAX_OUTPUT_TOKENS),
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+
+            response_text = response.content[0].text.strip()
+
+            # Remove markdown code blocks if present
+            response_text = _strip_code_fence(response_text)
+
+            import json
+
+            # Remove trailing commas and any text around the array
+            response_text = re.sub(r',(\s*[}\]])', r'\1', response_text)
+            json_match = re.search(r'\[[\s\S]*\]', response_text)
+            if json_match:
+                response_text = json_match.group(0)
+
+            items = json.loads(response_text)
+            if not isinstance(items, list):
+                raise ValueError("expected a JSON array of metadata objects")
+
+            # Match objects to videos by their number, falling back to position
+            results = [None] * len(videos)
+            for position, item in enumerate(items):
+                if not isinstance(item, dict):
+                    continue
+                number = item.pop('video', position + 1)
+                if isinstance(number, int) and 1 <= number <= len(videos):
+                    results[number - 1] = item
+
+            return results
+
+        except Exception as e:
+            raise Exception(f"Error generating batch metadata with Claude API: {e}")
+
     def generate_new_video_metadata(
         self,
         topic: str,
@@ -376,12 +575,8 @@ Return ONLY the JSON output."""
 
             response_text = response.content[0].text.strip()
 
-            # Clean up markdown code blocks
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1]) if len(lines) > 2 else response_text
-                if response_text.startswith('json'):
-                    response_text = response_text[4:].strip()
+            # Remove markdown code blocks if present
+            response_text = _strip_code_fence(response_text)
 
             import json
             metadata = json.loads(response_text)
@@ -472,12 +667,8 @@ Return ONLY the JSON output."""
 
             response_text = response.content[0].text.strip()
 
-            # Clean up markdown code blocks
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1]) if len(lines) > 2 else response_text
-                if response_text.startswith('json'):
-                    response_text = response_text[4:].strip()
+            # Remove markdown code blocks if present
+            response_text = _strip_code_fence(response_text)
 
             import json
             import re
@@ -607,12 +798,8 @@ Return ONLY the JSON output with all {num_options} options."""
 
             response_text = response.content[0].text.strip()
 
-            # Clean up markdown code blocks
-            if response_text.startswith('```'):
-                lines = response_text.split('\n')
-                response_text = '\n'.join(lines[1:-1]) if len(lines) > 2 else response_text
-                if response_text.startswith('json'):
-                    response_text = response_text[4:].strip()
+            # Remove markdown code blocks if present
+            response_text = _strip_code_fence(response_text)
 
             import json
             import re
@@ -638,7 +825,8 @@ Return ONLY the JSON output with all {num_options} options."""
         self,
         description: str,
         max_length: int = 250,
-        video_title: Optional[str] = None
+        video_title: Optional[str] = None,
+        on_text: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         Intelligently compress a description for Bilibili using LLM.
@@ -651,6 +839,8 @@ Return ONLY the JSON output with all {num_options} options."""
             description: Full description (bilingual or Chinese)
             max_length: Maximum character length for Bilibili (default 250)
             video_title: Optional video title for context
+            on_text: Optional callback; if given, the response is streamed and
+                each piece of text is passed to it as it arrives
 
         Returns:
             Compressed description that fits within max_length
@@ -659,6 +849,11 @@ Return ONLY the JSON output with all {num_options} options."""
         if len(description) <= max_length:
             return description
 
+        if self.cache is not None:
+            cached = self.cache.get_compression(description, max_length, video_title)
+            if cached is not None:
+                return cached
+
         prompt = f"""You are an expert at compressing video descriptions while preserving maximum information value.
 
 **Task:** Compress the following video description to fit within {max_length} characters while keeping the MOST important information.
@@ -697,16 +892,30 @@ Return ONLY the JSON output with all {num_options} options."""
 **Output:** Return ONLY the compressed description, nothing else. No explanations, no JSON, just the compressed text."""
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=1024,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            compressed = response.content[0].text.strip()
+            if on_text is None:
+                response = self.client.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=1024,
+                    messages=[{
+                        "role": "user",
+                        "content": prompt
+                    }]
+                )
+
+                compressed = response.content[0].text.strip()
+            else:
+                with self.client.messages.stream(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=1024,
+                    messages=[{
+                        "role": "user",
+                        "content": prompt
+                    }]
+                ) as stream:
+                    for text in stream.text_stream:
+                        on_text(text)
+
+                    compressed = stream.get_final_text().strip()
 
             # Safety check: if Claude exceeded limit, do hard truncation
             if len(compressed) > max_length:
@@ -725,13 +934,142 @@ Return ONLY the JSON output with all {num_options} options."""
                 else:
                     compressed = truncated.rstrip()
 
+            if self.cache is not None:
+                self.cache.set_compression(description, max_length, video_title, compressed)
+
             return compressed
 
         except Exception as e:
             # Fallback to simple truncation if LLM fails
-            console.print(f"[yellow]Warning: LLM compression failed ({e}), falling back to simple truncation[/yellow]")
+            print(f"Warning: LLM compression failed ({e}), falling back to simple truncation")
             return self._simple_truncate(description, max_length)
 
+    def compress_descriptions_for_bilibili_batch(
+        self,
+        items: List[Dict],
+        max_length: int = 250
+    ) -> List[Optional[str]]:
+        """
+        Compress several descriptions for Bilibili with one Claude request.
+
+        Descriptions already within the limit are returned as-is and left out
+        of the request.
+
+        Args:
+            items: Dictionaries with 'description' and optionally 'title'
+            max_length: Maximum character length for Bilibili (default 250)
+
+        Returns:
+            Compressed descriptions in the same order as items; None for any
+            description missing from the response
+
+        Raises:
+            Exception: If the Claude request fails or its response can't be parsed
+        """
+        results = [item['description'] if len(item['description']) <= max_length else None for item in items]
+        if self.cache is not None:
+            for i, item in enumerate(items):
+                if results[i] is None:
+                    results[i] = self.cache.get_compression(item['description'], max_length, item.get('title'))
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        sections = []
+        for number, i in enumerate(pending, 1):
+            title = items[i].get('title')
+            sections.append(f"""### Description {number}
+{f"**Video Title:** {title}" if title else ""}
+
+{items[i]['description']}""")
+        descriptions_str = '\n\n'.join(sections)
+
+        prompt = f"""You are an expert at compressing video descriptions while preserving maximum information value.
+
+**Task:** Compress each of the following {len(pending)} video descriptions to fit within {max_length} characters while keeping the MOST important information.
+
+{descriptions_str}
+
+**Compression Guidelines:**
+1. **Prioritize Chinese content** - If the description is bilingual, focus on Chinese section
+2. **Keep essential information:**
+   - Main topic/location
+   - Key highlights and activities
+   - Important tips or recommendations
+   - Call-to-action (subscribe/follow if present)
+3. **Remove or shorten:**
+   - Redundant descriptions
+   - Overly detailed explanations
+   - Generic filler words
+   - English section if bilingual (keep only Chinese)
+   - Timestamps (if necessary for space)
+   - Social media links (if necessary for space)
+4. **Writing style:**
+   - Concise and punchy
+   - Use emojis if they save space and add clarity
+   - Break into short, scannable lines
+   - Keep most engaging parts
+
+**Critical Requirements:**
+- Each output MUST be {max_length} characters or less
+- Must remain in Chinese (if original is Chinese/bilingual)
+- Should feel complete, not abruptly cut off
+- Preserve the video's core value proposition
+
+**Output Format (JSON array, one object per description, in the same order):**
+```json
+[
+  {{"description": 1, "compressed": "compressed description"}},
+  ...
+]
+```
+
+Return ONLY the JSON array, nothing else."""
+
+        try:
+            response = self.client.messages.create(
+                model="claude-sonnet-4-5-20250929",
+                max_tokens=min(1024 * len(pending), _MAX_OUTPUT_TOKENS),
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+
+            response_text = response.content[0].text.strip()
+
+            # Remove markdown code blocks if present
+            response_text = _strip_code_fence(response_text)
+
+            import json
+
+            # Remove trailing commas and any text around the array
+            response_text = re.sub(r',(\s*[}\]])', r'\1', response_text)
+            json_match = re.search(r'\[[\s\S]*\]', response_text)
+            if json_match:
+                response_text = json_match.group(0)
+
+            compressed_items = json.loads(response_text)
+            if not isinstance(compressed_items, list):
+                raise ValueError("expected a JSON array of compressed descriptions")
+
+            # Match objects to descriptions by their number, falling back to position
+            for position, item in enumerate(compressed_items):
+                if not isinstance(item, dict) or not isinstance(item.get('compressed'), str):
+                    continue
+                number = item.get('description', position + 1)
+                if isinstance(number, int) and 1 <= number <= len(pending):
+                    # Safety check: if Claude exceeded limit, do hard truncation
+                    index = pending[number - 1]
+                    results[index] = self._simple_truncate(item['compressed'].strip(), max_length)
+                    if self.cache is not None:
+                        self.cache.set_compression(items[index]['description'], max_length, items[index].get('title'), results[index])
+
+            return results
+
+        except Exception as e:
+            raise Exception(f"Error compressing descriptions with Claude API: {e}")
+
     def _simple_truncate(self, text: str, max_length: int) -> str:
         """
         Simple truncation fallback (used if LLM compression fails).
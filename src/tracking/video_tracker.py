@@ -1,13 +1,23 @@
 """Video processing tracker to avoid re-processing videos."""
 
+import atexit
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.utils import jsonio
+
 
 class VideoTracker:
-    """Tracks which videos have been processed to avoid duplicates."""
+    """
+    Tracks which videos have been processed to avoid duplicates.
+
+    Changes are appended to a journal next to the tracking file
+    (processed_videos.jsonl) as they happen, and folded back into the
+    tracking file itself when the tracker is flushed (at the latest, at exit).
+    """
 
     def __init__(self, tracking_file: str = 'processed_videos.json'):
         """
@@ -17,19 +27,62 @@ class VideoTracker:
             tracking_file: Path to JSON file for storing processed video IDs
         """
         self.tracking_file = Path(tracking_file)
+        self.journal_file = self.tracking_file.with_suffix('.jsonl')
         self.processed_videos = self._load_tracking_data()
 
+        # Fold the journal into the tracking file when the process exits
+        atexit.register(self.flush)
+
     def _load_tracking_data(self) -> Dict:
-        """Load tracking data from JSON file."""
+        """Load tracking data from JSON file, then replay any journaled changes."""
+        processed_videos = {}
         if self.tracking_file.exists():
             with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+                processed_videos = json.load(f)
+
+        self._journal_dirty = False
+        if self.journal_file.exists():
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = jsonio.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn write from an interrupted run
+                    self._journal_dirty = True
+                    if record.get('entry') is None:
+                        processed_videos.pop(record['video_id'], None)
+                    else:
+                        processed_videos[record['video_id']] = record['entry']
+
+        return processed_videos
+
+    def _append_to_journal(self, video_id: str, entry: Optional[Dict]):
+        """Record one change (an entry, or None for a removal) in the journal."""
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(jsonio.dumps({'video_id': video_id, 'entry': entry}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_dirty = True
 
     def _save_tracking_data(self):
-        """Save tracking data to JSON file."""
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
+        """Save tracking data to JSON file (atomically) and empty the journal."""
+        tmp_path = self.tracking_file.with_suffix(self.tracking_file.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(self.processed_videos, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.tracking_file)
+
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+        self._journal_dirty = False
+
+    def flush(self):
+        """Write journaled changes into the tracking file."""
+        if self._journal_dirty:
+            self._save_tracking_data()
 
     def is_processed(self, video_id: str) -> bool:
         """
@@ -85,7 +138,7 @@ class VideoTracker:
             }
 
         self.processed_videos[video_id] = entry
-        self._save_tracking_data()
+        self._append_to_journal(video_id, entry)
 
     def mark_as_tool_generated(self, video_id: str, title: str, video_info: Optional[Dict] = None):
         """
@@ -113,7 +166,7 @@ class VideoTracker:
             }
 
         self.processed_videos[video_id] = entry
-        self._save_tracking_data()
+        self._append_to_journal(video_id, entry)
 
     def get_processed_info(self, video_id: str) -> Optional[Dict]:
         """
@@ -150,7 +203,7 @@ class VideoTracker:
         """
         if video_id in self.processed_videos:
             del self.processed_videos[video_id]
-            self._save_tracking_data()
+            self._append_to_journal(video_id, None)
 
     def clear_all(self):
         """Clear all tracking data."""
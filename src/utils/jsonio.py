@@ -0,0 +1,51 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib codec
+    orjson = None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decode JSON from bytes, bytearray or str.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Encode a value as JSON text (non-ASCII characters are kept as-is).
+
+    Args:
+        obj: Value to encode
+        indent: Pretty-print with two-space indentation instead of compact output
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode('utf-8')
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode a value as UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode
+        indent: Pretty-print with two-space indentation instead of compact output
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,209 @@
+"""Title matching between YouTube and Bilibili videos, using RapidFuzz when it is installed."""
+
+from typing import Dict, List, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional speedup; fall back to a pure-Python Indel ratio
+    process = None
+
+
+def _optimal_assignment(num_rows: int, num_cols: int, weights: Dict[Tuple[int, int], float]) -> List[Tuple[int, int]]:
+    """
+    Find the maximum-weight assignment of rows to columns (Hungarian algorithm).
+
+    Every row also gets a zero-weight dummy column, so rows whose candidates are
+    better used elsewhere stay unassigned instead of being forced into a pair.
+
+    Args:
+        num_rows: Number of rows
+        num_cols: Number of columns
+        weights: (row, column) -> weight for the pairs that may be assigned
+
+    Returns:
+        List of assigned (row, column) pairs, all taken from weights
+    """
+    total_cols = num_cols + num_rows
+    inf = float('inf')
+
+    # Potentials, column -> assigned row (1-based, 0 = none), and augmenting path links
+    u = [0.0] * (num_rows + 1)
+    v = [0.0] * (total_cols + 1)
+    assigned_row = [0] * (total_cols + 1)
+    way = [0] * (total_cols + 1)
+
+    for row in range(1, num_rows + 1):
+        assigned_row[0] = row
+        col0 = 0
+        min_slack = [inf] * (total_cols + 1)
+        used = [False] * (total_cols + 1)
+
+        while True:
+            used[col0] = True
+            row0 = assigned_row[col0]
+            delta = inf
+            col1 = 0
+            for col in range(1, total_cols + 1):
+                if used[col]:
+                    continue
+                cost = -weights.get((row0 - 1, col - 1), 0.0) if col <= num_cols else 0.0
+                slack = cost - u[row0] - v[col]
+                if slack < min_slack[col]:
+                    min_slack[col] = slack
+                    way[col] = col0
+                if min_slack[col] < delta:
+                    delta = min_slack[col]
+                    col1 = col
+
+            for col in range(total_cols + 1):
+                if used[col]:
+                    u[assigned_row[col]] += delta
+                    v[col] -= delta
+                else:
+                    min_slack[col] -= delta
+
+            col0 = col1
+            if assigned_row[col0] == 0:
+                break
+
+        # Flip the augmenting path
+        while col0:
+            col1 = way[col0]
+            assigned_row[col0] = assigned_row[col1]
+            col0 = col1
+
+    return [
+        (assigned_row[col] - 1, col - 1)
+        for col in range(1, num_cols + 1)
+        if assigned_row[col] and (assigned_row[col] - 1, col - 1) in weights
+    ]
+
+
+def _char_masks(text: str) -> Dict[str, int]:
+    """Map each character of text to a bitmask of the positions it occurs at."""
+    masks = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _indel_ratio(text: str, other_len: int, other_masks: Dict[str, int]) -> float:
+    """
+    Indel similarity of two strings: 2 * LCS / total length (what RapidFuzz's fuzz.ratio computes).
+
+    The longest common subsequence is found with Hyyro's bit-parallel algorithm,
+    one big-integer step per character of text.
+
+    Args:
+        text: First string
+        other_len: Length of the second string
+        other_masks: _char_masks() of the second string
+
+    Returns:
+        Similarity from 0.0 to 1.0 (1.0 for two empty strings)
+    """
+    total = len(text) + other_len
+    if not total:
+        return 1.0
+
+    full = (1 << other_len) - 1
+    row = full
+    for char in text:
+        matches = row & other_masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+
+    # Each zero bit left in the row is one character of the LCS
+    lcs = other_len - bin(row).count('1')
+    return 2 * lcs / total
+
+
+def match_by_title(
+    match_titles: List[str],
+    bili_titles: List[str],
+    threshold: float = 0.5
+) -> List[Tuple[int, int, float]]:
+    """
+    Pair YouTube titles with Bilibili titles so the total similarity is as high as possible.
+
+    Each title is used at most once and only pairs at or above the threshold are
+    considered. Pairs are chosen by optimal assignment over all candidates, so an
+    early YouTube title can't take a Bilibili title that fits a later one better.
+    Similarity is the case-insensitive Indel ratio (0.0-1.0), computed with RapidFuzz
+    when it is installed and with _indel_ratio otherwise; both give the same scores.
+
+    Args:
+        match_titles: YouTube titles to match
+        bili_titles: Bilibili titles to match against
+        threshold: Minimum similarity for a pair to count as a match
+
+    Returns:
+        List of (YouTube index, Bilibili index, similarity) tuples, in YouTube order
+    """
+    # Lowercase every title once, not once per pair
+    bili_lower = [title.lower() for title in bili_titles]
+    yt_lower = [title.lower() for title in match_titles]
+
+    # Score each distinct YouTube title once; duplicates (re-uploads, series
+    # with templated titles) share its list of (Bilibili index, similarity)
+    scores_by_title = {}
+    if process is not None:
+        for title in dict.fromkeys(yt_lower):
+            scores_by_title[title] = [
+                (bili_idx, score / 100)
+                for _, score, bili_idx in process.extract(
+                    title, bili_lower,
+                    scorer=fuzz.ratio, processor=None, score_cutoff=threshold * 100, limit=None
+                )
+            ]
+    else:
+        # Index each Bilibili title once, not once per pair
+        bili_masks = [(len(bt_lower), _char_masks(bt_lower)) for bt_lower in bili_lower]
+        for title in dict.fromkeys(yt_lower):
+            scores = scores_by_title[title] = []
+            for bili_idx, (bili_len, masks) in enumerate(bili_masks):
+                # Skip pairs whose length-based upper bound can't reach the threshold
+                total = len(title) + bili_len
+                if total and 2 * min(len(title), bili_len) / total < threshold:
+                    continue
+
+                ratio = _indel_ratio(title, bili_len, masks)
+                if ratio >= threshold:
+                    scores.append((bili_idx, ratio))
+
+    # Candidate pairs: (YouTube index, Bilibili index) -> similarity
+    candidates = {
+        (yt_idx, bili_idx): ratio
+        for yt_idx, title in enumerate(yt_lower)
+        for bili_idx, ratio in scores_by_title[title]
+    }
+
+    # Titles only compete with titles they share a candidate with, so solve
+    # each connected group of candidates on its own (most are tiny)
+    parent = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for yt_idx, bili_idx in candidates:
+        parent[find(('yt', yt_idx))] = find(('bili', bili_idx))
+
+    groups = {}
+    for pair in candidates:
+        groups.setdefault(find(('yt', pair[0])), []).append(pair)
+
+    pairs = []
+    for group in groups.values():
+        yt_ids = sorted({yt_idx for yt_idx, _ in group})
+        bili_ids = sorted({bili_idx for _, bili_idx in group})
+        yt_pos = {yt_idx: i for i, yt_idx in enumerate(yt_ids)}
+        bili_pos = {bili_idx: j for j, bili_idx in enumerate(bili_ids)}
+
+        weights = {(yt_pos[yt_idx], bili_pos[bili_idx]): candidates[(yt_idx, bili_idx)] for yt_idx, bili_idx in group}
+        for i, j in _optimal_assignment(len(yt_ids), len(bili_ids), weights):
+            pairs.append((yt_ids[i], bili_ids[j], weights[(i, j)]))
+
+    pairs.sort()
+    return pairs
@@ -21,12 +21,13 @@ from src.thumbnail_generator.generator import ThumbnailGenerator
 
 # Global YouTube service - initialize once and reuse
 _youtube_service = None
+_youtube_credentials = None
 _youtube_service_lock = threading.Lock()
 
 
 def get_authenticated_service():
     """Get authenticated YouTube service (singleton pattern for thread safety)."""
-    global _youtube_service
+    global _youtube_service, _youtube_credentials
 
     with _youtube_service_lock:
         if _youtube_service is None:
@@ -38,6 +39,7 @@ def get_authenticated_service():
                 print("[DEBUG] Creating new YouTube service instance...")
                 auth = YouTubeAuthenticator()
                 _youtube_service = auth.get_youtube_service()
+                _youtube_credentials = auth.credentials
                 print("[DEBUG] YouTube service created successfully")
             finally:
                 socket.setdefaulttimeout(default_timeout)
@@ -99,7 +101,7 @@ def get_analytics_dashboard():
         # Get authenticated YouTube service
         youtube_service = get_authenticated_service()
         youtube_client = YouTubeClient(youtube_service)
-        tracker = AnalyticsTracker(youtube_service)
+        tracker = AnalyticsTracker(youtube_service, _youtube_credentials)
 
         # Fetch analytics data
         channel_data = tracker.fetch_channel_analytics()
@@ -1,21 +1,132 @@
 """YouTube Data API client for video operations."""
 
-from typing import List, Dict, Optional
+import json
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Iterator, List, Dict, Optional
 from googleapiclient.errors import HttpError
 
+# Parts requested for every video, so all lookups produce the same dictionary
+_VIDEO_PARTS = 'snippet,statistics,contentDetails,recordingDetails'
+
+
+def _parse_video(item: Dict) -> Dict:
+    """Convert a videos.list item into a video dictionary."""
+    video_data = {
+        'id': item['id'],
+        'title': item['snippet']['title'],
+        'description': item['snippet']['description'],
+        'tags': item['snippet'].get('tags', []),
+        'categoryId': item['snippet']['categoryId'],
+        'publishedAt': item['snippet']['publishedAt'],
+        'defaultLanguage': item['snippet'].get('defaultLanguage'),
+        'defaultAudioLanguage': item['snippet'].get('defaultAudioLanguage'),
+        'duration': item['contentDetails'].get('duration'),
+        'viewCount': item['statistics'].get('viewCount', '0'),
+        'likeCount': item['statistics'].get('likeCount', '0'),
+    }
+
+    # Add recording details if available
+    if 'recordingDetails' in item:
+        recording_details = item['recordingDetails']
+        video_data['recordingDate'] = recording_details.get('recordingDate')
+        if 'location' in recording_details:
+            video_data['recordingLocation'] = recording_details['location'].get('description')
+
+    return video_data
+
 
 class YouTubeClient:
     """Client for interacting with YouTube Data API v3."""
 
-    def __init__(self, youtube_service):
+    def __init__(
+        self,
+        youtube_service,
+        cache_path: Optional[str] = None,
+        cache_ttl: int = 0,
+        refresh_cache: bool = False
+    ):
         """
         Initialize the YouTube client.
 
         Args:
             youtube_service: Authenticated YouTube API service object
+            cache_path: SQLite file for cached video data
+                (default: ~/.cache/youtube_client/videos.db)
+            cache_ttl: Seconds to reuse cached video details and channel listings
+                (0 disables the cache)
+            refresh_cache: Ignore cached entries, but still store fresh results
         """
         self.youtube = youtube_service
 
+        # On-disk cache of video details and channel listings
+        self.cache_ttl = cache_ttl
+        self.refresh_cache = refresh_cache
+        self._cache_lock = Lock()
+        self._cache = None
+        if cache_ttl > 0:
+            path = Path(cache_path) if cache_path else Path.home() / '.cache' / 'youtube_client' / 'videos.db'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._cache = sqlite3.connect(str(path), check_same_thread=False)
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS videos (id TEXT PRIMARY KEY, json TEXT, ts INTEGER)'
+            )
+            self._cache.execute(
+                'CREATE TABLE IF NOT EXISTS listings (channel_id TEXT PRIMARY KEY, json TEXT, ts INTEGER)'
+            )
+            self._cache.commit()
+
+    def _cache_get(self, table: str, key_column: str, key: str):
+        """Return a cached value if present and fresh."""
+        if self._cache is None or self.refresh_cache:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute(
+                f'SELECT json, ts FROM {table} WHERE {key_column} = ?', (key,)
+            ).fetchone()
+        if row and time.time() - row[1] < self.cache_ttl:
+            return json.loads(row[0])
+        return None
+
+    def _cache_set_videos(self, videos: List[Dict]):
+        """Store fetched video details, keyed by video ID."""
+        if self._cache is None:
+            return
+        now = int(time.time())
+        with self._cache_lock:
+            self._cache.executemany(
+                'INSERT OR REPLACE INTO videos (id, json, ts) VALUES (?, ?, ?)',
+                [(video['id'], json.dumps(video, ensure_ascii=False), now) for video in videos]
+            )
+            self._cache.commit()
+
+    def _cache_set_listing(self, channel_key: str, videos: List[Dict]):
+        """Store a channel's full video listing."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO listings (channel_id, json, ts) VALUES (?, ?, ?)',
+                (channel_key, json.dumps(videos, ensure_ascii=False), int(time.time()))
+            )
+            self._cache.commit()
+
+    def invalidate(self, video_id: str):
+        """
+        Drop cached data that includes a video (its details and any channel listing).
+
+        Args:
+            video_id: YouTube video ID
+        """
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute('DELETE FROM videos WHERE id = ?', (video_id,))
+            self._cache.execute('DELETE FROM listings')
+            self._cache.commit()
+
     def get_channel_id(self) -> str:
         """
         Get the authenticated user's channel ID.
@@ -51,18 +162,40 @@ class YouTubeClient:
         Returns:
             List of video dictionaries with id, title, description, tags, etc.
         """
+        return list(self.iter_all_channel_videos(channel_id))
+
+    def iter_all_channel_videos(self, channel_id: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield all videos from a channel, one page of search results at a time.
+
+        Details for each page are fetched as soon as the page arrives, so callers
+        can start on the first videos while later pages are still being listed.
+        The listing is cached once it has been read to the end.
+
+        Args:
+            channel_id: Channel ID (if None, uses authenticated user's channel)
+
+        Yields:
+            Video dictionaries with id, title, description, tags, etc.
+        """
+        channel_key = channel_id or 'mine'
+        cached = self._cache_get('listings', 'channel_id', channel_key)
+        if cached is not None:
+            print(f"Using cached listing of {len(cached)} videos.")
+            yield from cached
+            return
+
         if channel_id is None:
             channel_id = self.get_channel_id()
 
         videos = []
+        seen_ids = set()
         page_token = None
 
         print(f"Fetching videos from channel: {channel_id}")
 
-        try:
-            # First, get all video IDs using search endpoint
-            video_ids = []
-            while True:
+        while True:
+            try:
                 search_request = self.youtube.search().list(
                     part='id',
                     channelId=channel_id,
@@ -72,49 +205,38 @@ class YouTubeClient:
                 )
                 search_response = search_request.execute()
 
+                video_ids = []
                 for item in search_response.get('items', []):
                     if item['id']['kind'] == 'youtube#video':
                         video_id = item['id']['videoId']
                         # Deduplicate: YouTube Search API can return same video multiple times
-                        if video_id not in video_ids:
+                        if video_id not in seen_ids:
+                            seen_ids.add(video_id)
                             video_ids.append(video_id)
 
-                page_token = search_response.get('nextPageToken')
-                if not page_token:
-                    break
+                # A search page holds at most 50 IDs, the videos.list limit
+                page_videos = []
+                if video_ids:
+                    videos_request = self.youtube.videos().list(
+                        part=_VIDEO_PARTS,
+                        id=','.join(video_ids)
+                    )
+                    videos_response = videos_request.execute()
+                    page_videos = [_parse_video(item) for item in videos_response.get('items', [])]
 
-            print(f"Found {len(video_ids)} unique videos. Fetching details...")
+            except HttpError as e:
+                raise Exception(f"Error fetching channel videos: {e}")
 
-            # Fetch video details in batches of 50 (API limit)
-            for i in range(0, len(video_ids), 50):
-                batch_ids = video_ids[i:i + 50]
-                videos_request = self.youtube.videos().list(
-                    part='snippet,statistics,contentDetails',
-                    id=','.join(batch_ids)
-                )
-                videos_response = videos_request.execute()
-
-                for item in videos_response.get('items', []):
-                    video_data = {
-                        'id': item['id'],
-                        'title': item['snippet']['title'],
-                        'description': item['snippet']['description'],
-                        'tags': item['snippet'].get('tags', []),
-                        'categoryId': item['snippet']['categoryId'],
-                        'publishedAt': item['snippet']['publishedAt'],
-                        'defaultLanguage': item['snippet'].get('defaultLanguage'),
-                        'defaultAudioLanguage': item['snippet'].get('defaultAudioLanguage'),
-                        'duration': item['contentDetails'].get('duration'),
-                        'viewCount': item['statistics'].get('viewCount', '0'),
-                        'likeCount': item['statistics'].get('likeCount', '0'),
-                    }
-                    videos.append(video_data)
-
-            print(f"Successfully fetched details for {len(videos)} videos.")
-            return videos
+            self._cache_set_videos(page_videos)
+            videos.extend(page_videos)
+            yield from page_videos
 
-        except HttpError as e:
-            raise Exception(f"Error fetching channel videos: {e}")
+            page_token = search_response.get('nextPageToken')
+            if not page_token:
+                break
+
+        self._cache_set_listing(channel_key, videos)
+        print(f"Successfully fetched details for {len(videos)} videos.")
 
     def get_video_details(self, video_id: str) -> Dict:
         """
@@ -126,36 +248,20 @@ class YouTubeClient:
         Returns:
             Dictionary with video metadata
         """
+        cached = self._cache_get('videos', 'id', video_id)
+        if cached is not None:
+            return cached
+
         try:
             request = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails,recordingDetails',
+                part=_VIDEO_PARTS,
                 id=video_id
             )
             response = request.execute()
 
             if 'items' in response and len(response['items']) > 0:
-                item = response['items'][0]
-                video_data = {
-                    'id': item['id'],
-                    'title': item['snippet']['title'],
-                    'description': item['snippet']['description'],
-                    'tags': item['snippet'].get('tags', []),
-                    'categoryId': item['snippet']['categoryId'],
-                    'publishedAt': item['snippet']['publishedAt'],
-                    'defaultLanguage': item['snippet'].get('defaultLanguage'),
-                    'defaultAudioLanguage': item['snippet'].get('defaultAudioLanguage'),
-                    'duration': item['contentDetails'].get('duration'),
-                    'viewCount': item['statistics'].get('viewCount', '0'),
-                    'likeCount': item['statistics'].get('likeCount', '0'),
-                }
-
-                # Add recording details if available
-                if 'recordingDetails' in item:
-                    recording_details = item['recordingDetails']
-                    video_data['recordingDate'] = recording_details.get('recordingDate')
-                    if 'location' in recording_details:
-                        video_data['recordingLocation'] = recording_details['location'].get('description')
-
+                video_data = _parse_video(response['items'][0])
+                self._cache_set_videos([video_data])
                 return video_data
             else:
                 raise Exception(f"Video not found: {video_id}")
@@ -163,6 +269,48 @@ class YouTubeClient:
         except HttpError as e:
             raise Exception(f"Error fetching video details: {e}")
 
+    def get_videos_batch(self, video_ids: List[str], refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Get detailed information for several videos, 50 IDs per API request.
+
+        Args:
+            video_ids: YouTube video IDs
+            refresh: Fetch from the API even if cached details are available
+
+        Returns:
+            Dictionary mapping video ID to video metadata; IDs that were not
+            found are left out
+
+        Raises:
+            Exception: If an API request fails
+        """
+        videos = {}
+        missing = []
+        for video_id in dict.fromkeys(video_ids):
+            cached = None if refresh else self._cache_get('videos', 'id', video_id)
+            if cached is not None:
+                videos[video_id] = cached
+            else:
+                missing.append(video_id)
+
+        try:
+            for i in range(0, len(missing), 50):
+                request = self.youtube.videos().list(
+                    part=_VIDEO_PARTS,
+                    id=','.join(missing[i:i + 50])
+                )
+                response = request.execute()
+
+                fetched = [_parse_video(item) for item in response.get('items', [])]
+                self._cache_set_videos(fetched)
+                for video_data in fetched:
+                    videos[video_data['id']] = video_data
+
+        except HttpError as e:
+            raise Exception(f"Error fetching video details: {e}")
+
+        return videos
+
     def update_video_metadata(
         self,
         video_id: str,
@@ -189,31 +337,103 @@ class YouTubeClient:
         """
         try:
             # First, get current video details to preserve required fields
+            # (always fresh, so cached data can't overwrite recent edits)
+            self.invalidate(video_id)
             current = self.get_video_details(video_id)
 
-            # Build the update request
-            snippet = {
-                'title': title if title is not None else current['title'],
-                'description': description if description is not None else current['description'],
-                'categoryId': category_id if category_id is not None else current['categoryId']
-            }
-
-            # Add tags if provided
-            if tags is not None:
-                snippet['tags'] = tags
-            elif current.get('tags'):
-                snippet['tags'] = current['tags']
-
-            request = self.youtube.videos().update(
-                part='snippet',
-                body={
-                    'id': video_id,
-                    'snippet': snippet
-                }
-            )
+            request = self._update_request(video_id, current, title, description, tags, category_id)
             request.execute()
+            self.invalidate(video_id)
             print(f"Successfully updated video: {video_id}")
             return True
 
         except HttpError as e:
             raise Exception(f"Error updating video metadata: {e}")
+
+    def update_videos_metadata(self, updates: List[Dict]) -> Dict[str, Optional[Exception]]:
+        """
+        Update metadata for several videos, sending up to 50 updates per batch HTTP request.
+
+        Args:
+            updates: Dictionaries with 'video_id' and any of 'title', 'description',
+                'tags' and 'category_id' (same meaning as in update_video_metadata())
+
+        Returns:
+            Dictionary mapping each video ID to None if its update succeeded,
+            or to the Exception describing why it failed
+
+        Raises:
+            Exception: If current video details cannot be fetched
+        """
+        updates = {update['video_id']: update for update in updates}
+        results = {}
+
+        def on_done(request_id, response, exception):
+            if exception is not None:
+                results[request_id] = Exception(f"Error updating video metadata: {exception}")
+            else:
+                results[request_id] = None
+                self.invalidate(request_id)
+
+        # Current details fill in fields that aren't being changed (always fresh)
+        current_videos = self.get_videos_batch(list(updates), refresh=True)
+
+        video_ids = list(updates)
+        for i in range(0, len(video_ids), 50):
+            batch = self.youtube.new_batch_http_request(callback=on_done)
+            batch_size = 0
+
+            for video_id in video_ids[i:i + 50]:
+                current = current_videos.get(video_id)
+                if current is None:
+                    results[video_id] = Exception(f"Video not found: {video_id}")
+                    continue
+
+                update = updates[video_id]
+                batch.add(
+                    self._update_request(
+                        video_id, current,
+                        update.get('title'), update.get('description'),
+                        update.get('tags'), update.get('category_id')
+                    ),
+                    request_id=video_id
+                )
+                batch_size += 1
+
+            if batch_size:
+                try:
+                    batch.execute()
+                except HttpError as e:
+                    raise Exception(f"Error updating video metadata: {e}")
+
+        return results
+
+    def _update_request(
+        self,
+        video_id: str,
+        current: Dict,
+        title: Optional[str],
+        description: Optional[str],
+        tags: Optional[List[str]],
+        category_id: Optional[str]
+    ):
+        """Build a videos.update request, keeping current values for fields not given."""
+        snippet = {
+            'title': title if title is not None else current['title'],
+            'description': description if description is not None else current['description'],
+            'categoryId': category_id if category_id is not None else current['categoryId']
+        }
+
+        # Add tags if provided
+        if tags is not None:
+            snippet['tags'] = tags
+        elif current.get('tags'):
+            snippet['tags'] = current['tags']
+
+        return self.youtube.videos().update(
+            part='snippet',
+            body={
+                'id': video_id,
+                'snippet': snippet
+            }
+        )